@@ -8,6 +8,7 @@ from typing import TypedDict, Literal, List, Dict, Optional
 import logging
 import json
 import os
+import numpy as np
 from agent.decision_node import DecisionAgent
 from ingestion.youtube_ingest import YouTubeIngester
 from ingestion.podcast_ingest import PodcastIngester
@@ -304,11 +305,27 @@ class CelebrityQuestionGraph:
         # Extract question texts
         question_texts = [q['text'] for q in questions]
 
-        # Generate embeddings
-        embeddings = self.embedder.embed_batch(question_texts, show_progress=True)
+        # Generate embeddings, reusing stored vectors for questions already in
+        # the index (re-ingestion) so only new texts go through the model
+        known_ids = self.metadata_store.find_faiss_ids(celebrity_name, question_texts)
+        known_rows = [i for i, faiss_id in enumerate(known_ids) if faiss_id is not None]
+        new_rows = [i for i, faiss_id in enumerate(known_ids) if faiss_id is None]
+
+        embeddings = np.empty((len(question_texts), self.embedder.embedding_dim), dtype=np.float32)
+        if new_rows:
+            embeddings[new_rows] = self.embedder.embed_batch(
+                [question_texts[i] for i in new_rows],
+                show_progress=True
+            )
+        if known_rows:
+            logger.info(f"Reusing {len(known_rows)} stored embeddings")
+            embeddings[known_rows] = self.faiss_manager.reconstruct_vectors(
+                celebrity_name,
+                [known_ids[i] for i in known_rows]
+            )
 
-        # Add to FAISS
-        faiss_ids = self.faiss_manager.add_vectors(celebrity_name, embeddings)
+        # Add to FAISS (the embeddings buffer is ours, so normalize it in place)
+        faiss_ids = self.faiss_manager.add_vectors(celebrity_name, embeddings, inplace=True)
 
         # Prepare metadata
         metadata_list = []
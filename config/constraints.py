@@ -46,7 +46,7 @@ if OPENAI_API_KEY:
 
 
 # Whisper configuration
-WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "small")
+WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "distil-small.en")
 WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "en")
 
 
@@ -0,0 +1,126 @@
+"""
+Micro-Batcher Module
+Coalesces concurrent single-query embeddings into one embed_batch call
+Transformer encoders are throughput-bound, so one batch of N queries costs
+far less than N separate encode calls
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from embeddings.embedder import get_embedder
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Largest number of queries encoded in one batch
+MICRO_BATCH_MAX_SIZE = 32
+
+# How long the worker waits for more queries before encoding a partial batch
+MICRO_BATCH_MAX_WAIT_MS = 10
+
+
+class MicroBatcher:
+    """
+    Thread-safe queue that aggregates concurrent embed requests
+    Callers block in submit() while a background worker encodes batches
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], np.ndarray],
+        max_batch: int = MICRO_BATCH_MAX_SIZE,
+        max_wait_ms: float = MICRO_BATCH_MAX_WAIT_MS
+    ):
+        """
+        Args:
+            embed_batch: Function mapping a list of texts to an (n, dim) array
+            max_batch: Maximum texts per batch
+            max_wait_ms: Time window to collect more texts after the first arrives
+        """
+        self.embed_batch = embed_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[str, Future]] = []
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, text: str) -> np.ndarray:
+        """
+        Embed a single text as part of the next batch
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            numpy array of shape (embedding_dim,)
+        """
+        if not text or not text.strip():
+            raise ValueError("Cannot embed empty text")
+
+        future: Future = Future()
+
+        with self._condition:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embed-micro-batcher", daemon=True
+                )
+                self._worker.start()
+
+            self._pending.append((text, future))
+            self._condition.notify()
+
+        return future.result()
+
+    def _next_batch(self) -> List[Tuple[str, Future]]:
+        """Block until texts are queued, then collect up to max_batch within the window"""
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+
+            deadline = time.monotonic() + self.max_wait
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            return batch
+
+    def _run(self):
+        """Worker loop: encode each batch and resolve the callers' futures"""
+        while True:
+            batch = self._next_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                embeddings = self.embed_batch(texts)
+            except Exception as e:
+                logger.error(f"Error embedding batch of {len(texts)} queries: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
+
+# Global batcher instance
+_batcher_instance = None
+_batcher_lock = threading.Lock()
+
+def get_micro_batcher() -> MicroBatcher:
+    """
+    Get the global micro-batcher (singleton pattern)
+    Shares one queue across all retrievers so concurrent queries batch together
+    """
+    global _batcher_instance
+    if _batcher_instance is None:
+        with _batcher_lock:
+            if _batcher_instance is None:
+                _batcher_instance = MicroBatcher(get_embedder().embed_batch)
+    return _batcher_instance
@@ -16,6 +16,8 @@ class QuestionEmbedder:
     """
     Singleton embedder for converting questions to semantic vectors
     MUST use same model for storage and retrieval
+    all-MiniLM-L6-v2 ends in a Normalize layer, so embeddings are unit-norm
+    (QuestionRetriever relies on this to skip query normalization)
     """
 
     _instance = None
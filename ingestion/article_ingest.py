@@ -1,21 +1,32 @@
 """
 Article Ingestion Pipeline - WITH GOOGLE SEARCH + TAVILY FALLBACK
 Extracts questions from written interview articles
-SUPPORTS: Google Custom Search, Tavily API (fallback), newspaper3k, BeautifulSoup
+SUPPORTS: Google Custom Search, Tavily API (fallback), newspaper3k, selectolax/BeautifulSoup
 """
 
 from newspaper import Article
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 import re
 from datetime import datetime
 import os
 import time
+import json
+import hashlib
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from processing.question_extractor import get_question_extractor
 
+# Optional: selectolax (lexbor, C-backed) parses HTML much faster than BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,43 @@ DEFAULT_HEADERS = {
     'Upgrade-Insecure-Requests': '1',
 }
 
+# HEAD status codes that mean the article is definitely gone
+# (403/405 etc. are not included: scraper-blocking sites can still be fetched via Tavily)
+DEAD_URL_STATUS_CODES = {404, 410}
+
+# How long cached Google search responses stay valid (24 hours)
+GOOGLE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Tags stripped before extracting article text
+NON_CONTENT_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside']
+
+# CSS equivalent of the BS4 container selectors (article/content/post/entry/story)
+ARTICLE_CONTAINER_CSS = ', '.join(
+    ['article', 'main']
+    + [f'div[class*="{word}"]' for word in ('article', 'content', 'post', 'entry', 'story')]
+    + [f'div[id*="{word}"]' for word in ('article', 'content', 'post', 'entry', 'story')]
+)
+
+# Keywords that mark a search result as an interview
+INTERVIEW_KEYWORDS = ('interview', 'q&a', 'talks', 'conversation', 'sits down', 'speaks', 'discusses')
+
+# One case-insensitive alternation over all keywords (single C-level scan, no .lower() copy)
+INTERVIEW_KEYWORD_PATTERN = re.compile(
+    '|'.join(re.escape(keyword) for keyword in INTERVIEW_KEYWORDS),
+    re.IGNORECASE
+)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL for de-duplication
+    Lowercases the host and drops query string, fragment and trailing slash,
+    so tracking-parameter variants of the same article collapse together
+    """
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/') or '/'
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}"
+
 
 class ArticleIngester:
     """
@@ -38,8 +86,13 @@ class ArticleIngester:
     WITH: Google Search + Tavily API fallback for search AND fetch
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: str = "data/cache/google"):
         self.question_extractor = get_question_extractor(use_llm=True)
+        self.cache_dir = cache_dir
+
+        # Shared HTTP session (connection pooling for HEAD checks and page fetches)
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
 
         # Load Google API credentials
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
@@ -62,6 +115,21 @@ class ArticleIngester:
 
         self.search_enabled = self.google_search_enabled or self.tavily_enabled
 
+        # Build the Custom Search service once (static discovery doc, no network fetch)
+        self.cse_service = None
+        if self.google_search_enabled:
+            try:
+                self.cse_service = build(
+                    "customsearch", "v1",
+                    developerKey=self.google_api_key,
+                    cache_discovery=False,
+                    static_discovery=True
+                )
+            except Exception as e:
+                logger.error(f"Could not build Google Custom Search service: {e}")
+                self.google_search_enabled = False
+                self.search_enabled = self.tavily_enabled
+
     def fetch_article(self, url: str, max_retries: int = 3) -> Optional[Dict]:
         """
         Fetch and parse an article from a URL
@@ -76,6 +144,10 @@ class ArticleIngester:
         """
         logger.info(f"Fetching article: {url}")
 
+        # Cheap HEAD check first: skip dead URLs before any full download + parse
+        if self._is_dead_url(url):
+            return None
+
         # Method 1: newspaper3k with custom config
         article_data = self._fetch_with_newspaper3k(url, max_retries)
         if article_data and article_data.get('text'):
@@ -95,6 +167,34 @@ class ArticleIngester:
         logger.error(f"All fetch methods failed for: {url}")
         return None
 
+    def _is_dead_url(self, url: str) -> bool:
+        """
+        HEAD pre-check for stale search results
+        Only 404/410 and unreachable hosts count as dead; anything else
+        (including timeouts and HEAD-unfriendly servers) goes on to the fetchers
+        """
+        try:
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+        except requests.Timeout:
+            # ConnectTimeout subclasses ConnectionError; a slow host isn't a dead one
+            return False
+        except requests.exceptions.SSLError as e:
+            # Also a ConnectionError subclass; let the fetchers decide
+            logger.debug(f"HEAD check inconclusive for {url}: {e}")
+            return False
+        except requests.ConnectionError as e:
+            logger.warning(f"Skipping unreachable URL: {url} ({e})")
+            return True
+        except requests.RequestException as e:
+            logger.debug(f"HEAD check inconclusive for {url}: {e}")
+            return False
+
+        if response.status_code in DEAD_URL_STATUS_CODES:
+            logger.warning(f"Skipping dead URL ({response.status_code}): {url}")
+            return True
+
+        return False
+
     def _fetch_with_newspaper3k(self, url: str, max_retries: int = 3) -> Optional[Dict]:
         """Fetch article using newspaper3k with retry logic"""
         for attempt in range(max_retries):
@@ -132,52 +232,20 @@ class ArticleIngester:
         return None
 
     def _fetch_with_requests(self, url: str, max_retries: int = 3) -> Optional[Dict]:
-        """Fetch article using requests + BeautifulSoup with retry logic"""
+        """Fetch article using requests + selectolax/BeautifulSoup with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
-                    headers=DEFAULT_HEADERS,
                     timeout=30,
                     allow_redirects=True
                 )
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.content, 'lxml')
-
-                # Try to extract title
-                title = soup.find('h1')
-                if not title:
-                    title = soup.find('title')
-                title_text = title.get_text(strip=True) if title else url
-
-                # Remove script, style, nav, footer elements
-                for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-                    element.decompose()
-
-                # Get text from common article containers (prioritized)
-                article_text = ""
-
-                # Try specific article selectors first
-                selectors = [
-                    ('article', {}),
-                    ('div', {'class': re.compile(r'(article|content|post|entry|story)[-_]?(body|text|content)?', re.I)}),
-                    ('div', {'id': re.compile(r'(article|content|post|entry|story)', re.I)}),
-                    ('main', {}),
-                ]
-
-                for tag, attrs in selectors:
-                    containers = soup.find_all(tag, attrs) if attrs else soup.find_all(tag)
-                    for container in containers:
-                        text = container.get_text(separator='\n', strip=True)
-                        if len(text) > len(article_text):
-                            article_text = text
-
-                # Fallback to body text
-                if not article_text or len(article_text) < 200:
-                    body = soup.find('body')
-                    if body:
-                        article_text = body.get_text(separator='\n', strip=True)
+                if HTMLParser is not None:
+                    title_text, article_text = self._extract_with_selectolax(response.content, url)
+                else:
+                    title_text, article_text = self._extract_with_bs4(response.content, url)
 
                 if not article_text or len(article_text) < 100:
                     raise ValueError("Could not extract meaningful content")
@@ -203,6 +271,72 @@ class ArticleIngester:
         logger.warning(f"requests/BS4 failed for: {url}")
         return None
 
+    def _extract_with_selectolax(self, content: bytes, url: str) -> Tuple[str, str]:
+        """Extract (title, text) from HTML using selectolax"""
+        tree = HTMLParser(content)
+
+        # Try to extract title
+        title = tree.css_first('h1') or tree.css_first('title')
+        title_text = title.text(strip=True) if title else ''
+        title_text = title_text or url
+
+        # Remove script, style, nav, footer elements
+        tree.strip_tags(NON_CONTENT_TAGS)
+
+        # Keep the longest text among common article containers
+        article_text = ""
+        for node in tree.css(ARTICLE_CONTAINER_CSS):
+            text = node.text(separator='\n', strip=True)
+            if len(text) > len(article_text):
+                article_text = text
+
+        # Fallback to body text
+        if not article_text or len(article_text) < 200:
+            if tree.body is not None:
+                article_text = tree.body.text(separator='\n', strip=True)
+
+        return title_text, article_text
+
+    def _extract_with_bs4(self, content: bytes, url: str) -> Tuple[str, str]:
+        """Extract (title, text) from HTML using BeautifulSoup"""
+        soup = BeautifulSoup(content, 'lxml')
+
+        # Try to extract title
+        title = soup.find('h1')
+        if not title:
+            title = soup.find('title')
+        title_text = title.get_text(strip=True) if title else url
+
+        # Remove script, style, nav, footer elements
+        for element in soup(NON_CONTENT_TAGS):
+            element.decompose()
+
+        # Get text from common article containers (prioritized)
+        article_text = ""
+
+        # Try specific article selectors first
+        selectors = [
+            ('article', {}),
+            ('div', {'class': re.compile(r'(article|content|post|entry|story)[-_]?(body|text|content)?', re.I)}),
+            ('div', {'id': re.compile(r'(article|content|post|entry|story)', re.I)}),
+            ('main', {}),
+        ]
+
+        for tag, attrs in selectors:
+            containers = soup.find_all(tag, attrs) if attrs else soup.find_all(tag)
+            for container in containers:
+                text = container.get_text(separator='\n', strip=True)
+                if len(text) > len(article_text):
+                    article_text = text
+
+        # Fallback to body text
+        if not article_text or len(article_text) < 200:
+            body = soup.find('body')
+            if body:
+                article_text = body.get_text(separator='\n', strip=True)
+
+        return title_text, article_text
+
     def _fetch_with_tavily(self, url: str) -> Optional[Dict]:
         """
         FALLBACK: Fetch article content using Tavily API
@@ -361,6 +495,18 @@ class ArticleIngester:
             return []
 
         # Step 3: Add metadata
+        self._add_article_metadata(questions, article_data, celebrity_name)
+
+        logger.info(f"Extracted {len(questions)} questions from article")
+        return questions
+
+    def _add_article_metadata(
+        self,
+        questions: List[Dict],
+        article_data: Dict,
+        celebrity_name: str
+    ) -> List[Dict]:
+        """Attach article source metadata to each question dict (in place)"""
         publish_date = article_data.get('publish_date')
         if publish_date:
             if isinstance(publish_date, datetime):
@@ -373,13 +519,12 @@ class ArticleIngester:
         for question in questions:
             question['celebrity_name'] = celebrity_name
             question['source_type'] = 'article'
-            question['source_url'] = url
+            question['source_url'] = article_data['url']
             question['source_title'] = article_data['title']
             question['date'] = date_str
             question['timestamp'] = None  # Articles don't have timestamps
             question['authors'] = article_data.get('authors', [])
 
-        logger.info(f"Extracted {len(questions)} questions from article")
         return questions
 
     def search_articles(
@@ -409,11 +554,12 @@ class ArticleIngester:
             remaining = max_results - len(all_urls)
             tavily_urls = self._search_with_tavily(celebrity_name, remaining)
             # Add URLs not already found
-            seen = set(all_urls)
+            seen = {canonicalize_url(url) for url in all_urls}
             for url in tavily_urls:
-                if url not in seen:
+                canonical = canonicalize_url(url)
+                if canonical not in seen:
                     all_urls.append(url)
-                    seen.add(url)
+                    seen.add(canonical)
 
         if not all_urls:
             logger.warning(f"No articles found for {celebrity_name}")
@@ -435,8 +581,6 @@ class ArticleIngester:
         logger.info(f"Google Search: {celebrity_name} interview articles...")
 
         try:
-            service = build("customsearch", "v1", developerKey=self.google_api_key)
-
             search_queries = [
                 f'{celebrity_name} interview',
                 f'{celebrity_name} Q&A',
@@ -448,23 +592,28 @@ class ArticleIngester:
             for query in search_queries:
                 logger.info(f"  Query: {query}")
 
-                result = service.cse().list(
-                    q=query,
-                    cx=self.google_cse_id,
-                    num=min(max_results, 10)
-                ).execute()
+            # Run all queries concurrently; results are still merged in query order
+            with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+                results = list(executor.map(
+                    lambda query: self._google_query(query, min(max_results, 10)),
+                    search_queries
+                ))
 
+            for result in results:
                 if 'items' in result:
                     for item in result['items']:
                         url = item.get('link')
                         title = item.get('title', '')
                         snippet = item.get('snippet', '')
 
-                        if url and url not in seen_urls:
-                            content = (title + ' ' + snippet).lower()
-                            if any(keyword in content for keyword in ['interview', 'q&a', 'talks', 'conversation', 'sits down', 'speaks', 'discusses']):
+                        if not url:
+                            continue
+
+                        canonical = canonicalize_url(url)
+                        if canonical not in seen_urls:
+                            if INTERVIEW_KEYWORD_PATTERN.search(f"{title} {snippet}"):
                                 all_urls.append(url)
-                                seen_urls.add(url)
+                                seen_urls.add(canonical)
                                 logger.info(f"    Found: {title[:60]}...")
 
                 if len(all_urls) >= max_results:
@@ -477,6 +626,38 @@ class ArticleIngester:
             logger.error(f"Google search error: {e}")
             return []
 
+    def _google_query(self, query: str, num: int) -> Dict:
+        """
+        Run a Custom Search query, reusing a cached response if still fresh
+        Cache files live in cache_dir, keyed by sha256 of the query parameters
+        """
+        cache_key = hashlib.sha256(f"{self.google_cse_id}|{num}|{query}".encode()).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{cache_key}.json")
+
+        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < GOOGLE_CACHE_TTL_SECONDS:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    logger.debug(f"  Using cached Google results for: {query}")
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable Google cache {cache_path}: {e}")
+
+        # httplib2 is not thread-safe, so each query gets its own Http object
+        result = self.cse_service.cse().list(
+            q=query,
+            cx=self.google_cse_id,
+            num=num
+        ).execute(http=build_http())
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+        except OSError as e:
+            logger.debug(f"Could not write Google cache {cache_path}: {e}")
+
+        return result
+
     def _search_with_tavily(
         self,
         celebrity_name: str,
@@ -532,8 +713,7 @@ class ArticleIngester:
 
                         if url and url not in seen_urls:
                             # Filter for interview content
-                            text = (title + ' ' + content).lower()
-                            if any(keyword in text for keyword in ['interview', 'q&a', 'talks', 'conversation', 'sits down', 'speaks', 'discusses']):
+                            if INTERVIEW_KEYWORD_PATTERN.search(f"{title} {content}"):
                                 all_urls.append(url)
                                 seen_urls.add(url)
                                 logger.info(f"    Found: {title[:60]}...")
@@ -631,6 +811,8 @@ class ArticleIngester:
     ) -> List[Dict]:
         """
         Ingest multiple articles from a list of URLs
+        Heuristic candidates from all articles are refined in shared LLM
+        batches instead of one LLM round-trip per article
 
         Args:
             celebrity_name: Name of the celebrity
@@ -642,12 +824,43 @@ class ArticleIngester:
         logger.info(f"Starting article ingestion for: {celebrity_name}")
         logger.info(f"Processing {len(urls)} articles")
 
-        all_questions = []
+        # Phase 1: Fetch + cheap extraction (Q&A format or heuristic candidates)
+        article_questions = []  # (article_data, question dicts), in URL order
+        pending = []  # (slot in article_questions, heuristic candidates)
 
         for idx, url in enumerate(urls):
             logger.info(f"Processing article {idx+1}/{len(urls)}")
-            questions = self.process_article(url, celebrity_name)
-            all_questions.extend(questions)
+            article_data = self.fetch_article(url)
+            if not article_data:
+                continue
+
+            qa_questions = self.extract_qa_format(article_data['text'])
+            if qa_questions:
+                article_questions.append((article_data, qa_questions))
+                continue
+
+            candidates = self.question_extractor.extract_questions_heuristic(article_data['text'])
+            if not candidates:
+                logger.warning(f"No questions found in article: {url}")
+                continue
+
+            pending.append((len(article_questions), candidates))
+            article_questions.append((article_data, []))
+
+        # Phase 2: One batched LLM refinement across all articles
+        if pending:
+            refined_groups = self.question_extractor.refine_question_groups(
+                [candidates for _, candidates in pending]
+            )
+            for (slot, _), refined in zip(pending, refined_groups):
+                article_questions[slot][1].extend(
+                    {'text': q, 'extraction_method': 'heuristic'} for q in refined
+                )
+
+        # Phase 3: Attach source metadata
+        all_questions = []
+        for article_data, questions in article_questions:
+            all_questions.extend(self._add_article_metadata(questions, article_data, celebrity_name))
 
         logger.info(f"Article ingestion complete: {len(all_questions)} total questions from {len(urls)} articles")
 
@@ -736,23 +949,7 @@ class ArticleIngester:
             return []
 
         # Add metadata
-        publish_date = article_data.get('publish_date')
-        if publish_date:
-            if isinstance(publish_date, datetime):
-                date_str = publish_date.strftime('%Y-%m-%d')
-            else:
-                date_str = str(publish_date)
-        else:
-            date_str = None
-
-        for question in questions:
-            question['celebrity_name'] = celebrity_name
-            question['source_type'] = 'article'
-            question['source_url'] = article_data['url']
-            question['source_title'] = article_data['title']
-            question['date'] = date_str
-            question['timestamp'] = None
-            question['authors'] = article_data.get('authors', [])
+        self._add_article_metadata(questions, article_data, celebrity_name)
 
         logger.info(f"Extracted {len(questions)} questions from: {article_data['title'][:50]}")
         return questions
@@ -6,18 +6,187 @@ Downloads MP3 audio, transcribes, and extracts questions
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, FrozenSet, Callable, Iterator, Tuple, Any
 import logging
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
 import hashlib
+import glob
+import pickle
+import shutil
+import time
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from functools import lru_cache
+from io import BytesIO
+from types import SimpleNamespace
 from transcription.whisper_transcriber import get_transcriber
 from processing.question_extractor import get_question_extractor
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Headers sent when fetching RSS feeds
+FEED_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; PodcastBot/1.0)'}
+
+# Surnames too common to identify a celebrity on their own
+COMMON_SURNAMES = frozenset({'smith', 'brown', 'jones', 'white', 'black', 'green', 'young', 'king', 'hill'})
+
+# XML namespaces of the podcast fields read by parse_rss
+ITUNES_NS = '{http://www.itunes.com/dtds/podcast-1.0.dtd}'
+MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+
+# ASCII letters from rarest to most common in English text, used for a cheap
+# name prefilter. 'i', 'k' and 's' are left out: IGNORECASE regexes also match
+# them against non-ASCII letters (İ, ı, K, ſ), so a plain check could miss a hit
+RARE_LETTER_ORDER = "zqxjvbpygfwmucldrhnoate"
+
+# Maximum number of RSS feeds fetched at the same time (avoid hammering CDNs)
+MAX_FEED_WORKERS = 8
+
+# Only scan this many of the newest entries per feed (some feeds ship 1000+)
+MAX_ENTRIES_PER_FEED = 100
+
+# Per-feed HTTP timeout (feedparser's own fetcher has none)
+FEED_TIMEOUT_SECONDS = 30
+
+# Reuse a parsed feed in memory for this long when it has no <ttl> (seconds)
+FEED_MEMO_TTL_SECONDS = 3600
+
+# Subdirectory of download_dir holding audio stored by URL hash
+AUDIO_STORE_DIRNAME = "store"
+
+# Reuse a YouTube fallback search result for this long (seconds)
+YOUTUBE_SEARCH_TTL_SECONDS = 3600
+
+# Keep-alive connections per host in the shared session (covers all feed/download workers)
+HTTP_POOL_SIZE = 16
+
+# Copy buffer for audio downloads (1MB keeps the copy loop in C)
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+# Parallel audio downloads in the episode pipeline (network-bound)
+MAX_DOWNLOAD_WORKERS = 4
+
+# Parallel question extractions in the episode pipeline (LLM-bound)
+MAX_EXTRACT_WORKERS = 2
+
+
+def url_hash(url: str) -> str:
+    """
+    Short, stable hash of a URL for filename disambiguation
+    Not a security use; the algorithm must stay fixed so existing downloads keep their names
+    """
+    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+def format_published_date(published: str) -> str:
+    """
+    Normalize an RSS/Atom published date to YYYY-MM-DD
+    Accepts every RFC 2822 variant (RSS pubDate), ISO 8601 (Atom) and
+    yt-dlp's YYYYMMDD upload_date; returns the raw string if none parses
+    """
+    # yt-dlp upload_date: plain slicing, no parser needed
+    if len(published) == 8 and published.isdigit():
+        return f"{published[:4]}-{published[4:6]}-{published[6:]}"
+
+    try:
+        return parsedate_to_datetime(published).strftime('%Y-%m-%d')
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    try:
+        return datetime.fromisoformat(published).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        return published
+
+
+def parse_rss(content: bytes) -> Optional[SimpleNamespace]:
+    """
+    Fast RSS 2.0 parse that keeps only the fields the episode scan reads
+    Streams <item> elements with lxml instead of running feedparser's
+    full normalization/sanitizing pass over every entry
+
+    Args:
+        content: Raw feed bytes
+
+    Returns:
+        Object shaped like a feedparser result (.feed, .entries, .bozo),
+        or None if lxml is missing or the document is not well-formed RSS
+        (callers should fall back to feedparser)
+    """
+    if etree is None:
+        return None
+
+    channel = {}
+    entries = []
+
+    try:
+        # No entity expansion or network access for untrusted feeds
+        context = etree.iterparse(
+            BytesIO(content),
+            events=('end',),
+            resolve_entities=False,
+            no_network=True,
+        )
+
+        for _, elem in context:
+            if elem.tag == 'item':
+                entries.append(_rss_item_to_entry(elem))
+                # Free finished items so large feeds stay small in memory
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            elif elem.tag in ('title', 'ttl'):
+                parent = elem.getparent()
+                if parent is not None and parent.tag == 'channel':
+                    channel[elem.tag] = (elem.text or '').strip()
+
+        if context.root is None or context.root.tag != 'rss':
+            return None  # Atom or something else: let feedparser handle it
+
+    except etree.XMLSyntaxError:
+        return None
+
+    return SimpleNamespace(feed=channel, entries=entries, bozo=False)
+
+
+def _rss_item_to_entry(item) -> Dict:
+    """Convert an RSS <item> element to a feedparser-style entry dict (present fields only)"""
+    entry = {}
+
+    for key, tag in (
+        ('title', 'title'),
+        ('description', 'description'),
+        ('link', 'link'),
+        ('published', 'pubDate'),
+        ('itunes_duration', f'{ITUNES_NS}duration'),
+    ):
+        child = item.find(tag)
+        if child is not None:
+            entry[key] = (child.text or '').strip()
+
+    entry['enclosures'] = [
+        {'href': enc.get('url'), 'type': enc.get('type', '')}
+        for enc in item.iterfind('enclosure')
+    ]
+    entry['media_content'] = [
+        {'url': media.get('url'), 'type': media.get('type', '')}
+        for media in item.iterfind(f'{MEDIA_NS}content')
+    ]
+
+    return entry
+
 
 class PodcastIngester:
     """
@@ -27,7 +196,7 @@ class PodcastIngester:
     """
 
     # Popular podcast RSS feeds that commonly feature celebrity interviews
-    POPULAR_PODCASTS = [
+    POPULAR_PODCASTS: Tuple[str, ...] = (
         # Long-form interview podcasts
         "https://feeds.megaphone.fm/the-tim-ferriss-show",
         "https://feeds.simplecast.com/54nAGcIl",  # Lex Fridman Podcast
@@ -43,50 +212,159 @@ class PodcastIngester:
         "https://feeds.megaphone.fm/entdaily",  # Entertainment Weekly
         "https://rss.art19.com/variety-awards-circuit",  # Variety Awards Circuit
         "https://feeds.megaphone.fm/hollywoodreporter",  # Hollywood Reporter
-    ]
+    )
+
+    # Set mirror of POPULAR_PODCASTS for O(1) membership checks
+    _popular_set: FrozenSet[str] = frozenset(POPULAR_PODCASTS)
 
     def __init__(self, download_dir: str = "data/downloads/podcasts"):
         self.download_dir = download_dir
         os.makedirs(download_dir, exist_ok=True)
-        self.transcriber = get_transcriber()
+        # Feeds added with add_custom_feed (per instance; dict keeps insertion order)
+        self._custom_feeds: Dict[str, None] = {}
+        # Shared HTTP session: pooled connections, reused across feed fetches and
+        # audio downloads (episodes mostly come from a few CDNs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Feed bodies + ETag/Last-Modified validators, persisted between runs
+        self.feed_cache_path = os.path.join(download_dir, ".feed_cache.pkl")
+        self._feed_cache = self._load_feed_cache()
+        self._feed_cache_dirty = False
+        # Parsed feeds kept in memory for their TTL: feed_url -> (expires_at, feed)
+        self._parsed_feeds: Dict[str, Tuple[float, Any]] = {}
+        # YouTube fallback searches: (query, max_results) -> (expires_at, entries)
+        self._youtube_search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
         self.question_extractor = get_question_extractor(use_llm=True)
 
+    @property
+    def transcriber(self):
+        """
+        Process-wide Whisper transcriber, loaded on first use
+        Creating ingesters (or only searching feeds) never loads the model
+        """
+        return get_transcriber()
+
     def _name_matches(self, celebrity_name: str, text: str) -> bool:
         """
         Check if celebrity name matches text with flexible matching
         Handles partial matches (first name, last name, common variations)
         """
-        celebrity_lower = celebrity_name.lower().strip()
-        text_lower = text.lower()
+        return self._build_name_matcher(celebrity_name)(text)
 
-        # Exact full name match
-        if celebrity_lower in text_lower:
-            return True
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_name_matcher(celebrity_name: str) -> Callable[[str], bool]:
+        """
+        Compile the name-matching rules for one celebrity into regexes
+        Cached per name, so repeated searches and _name_matches calls reuse
+        the same compiled matcher instead of re-splitting the name
 
-        # Split name into parts
-        name_parts = celebrity_lower.split()
+        A text matches if it contains (case-insensitive, whole words):
+        - the full name, or "Last, First"
+        - a distinctive last name on its own (>4 chars, not a common surname)
+        - both the first AND the last name, anywhere
 
-        if len(name_parts) >= 2:
-            # Check if both first AND last name appear (not necessarily together)
-            first_name = name_parts[0]
-            last_name = name_parts[-1]
+        Returns:
+            Function text -> bool
+        """
+        name_parts = celebrity_name.lower().split()
+        if not name_parts:
+            return lambda text: False
 
-            # Both names must appear for partial match
-            if first_name in text_lower and last_name in text_lower:
-                return True
+        def whole_word(*words: str) -> str:
+            # Words separated by any whitespace, not embedded in a longer word
+            return r'(?<!\w)' + r'\s+'.join(re.escape(w) for w in words) + r'(?!\w)'
+
+        # Patterns where a single hit is enough
+        direct = [whole_word(*name_parts)]
+
+        if len(name_parts) < 2:
+            direct_pattern = re.compile(direct[0], re.IGNORECASE)
+            return lambda text: direct_pattern.search(text) is not None
+
+        first_name = name_parts[0]
+        last_name = name_parts[-1]
+
+        # "Last, First" format
+        direct.append(whole_word(f"{last_name},", first_name))
 
-            # Check for "Last, First" format
-            if f"{last_name}, {first_name}" in text_lower:
+        # Last name alone only if it's distinctive
+        if len(last_name) > 4 and last_name not in COMMON_SURNAMES:
+            direct.append(whole_word(last_name))
+
+        direct_pattern = re.compile('|'.join(direct), re.IGNORECASE)
+        first_pattern = re.compile(whole_word(first_name), re.IGNORECASE)
+        last_pattern = re.compile(whole_word(last_name), re.IGNORECASE)
+
+        # Every rule needs the last name, so a text without its rarest letter
+        # (either case) can be rejected without running any regex
+        rare_letter = next((c for c in RARE_LETTER_ORDER if c in last_name), None)
+        rare_upper = rare_letter.upper() if rare_letter else None
+
+        def matches(text: str) -> bool:
+            if rare_letter and rare_letter not in text and rare_upper not in text:
+                return False
+            if direct_pattern.search(text):
                 return True
+            # Both names must appear for partial match
+            return bool(last_pattern.search(text) and first_pattern.search(text))
 
-            # Last name alone only if it's distinctive (>4 chars)
-            if len(last_name) > 4 and last_name in text_lower:
-                # Verify it's not a common word
-                common_words = {'smith', 'brown', 'jones', 'white', 'black', 'green', 'young', 'king', 'hill'}
-                if last_name not in common_words:
-                    return True
+        return matches
 
-        return False
+    @staticmethod
+    def _build_multi_name_matcher(celebrity_names: List[str]) -> Callable[[str], List[str]]:
+        """
+        Compile name matching for many celebrities into a single regex
+        One scan per text finds every first/last name present; each celebrity's
+        rule is then checked against that set. This is equivalent to
+        _build_name_matcher: a full name or "Last, First" always contains
+        both names, so the rules reduce to "first AND last" or
+        "distinctive last name alone"
+
+        Returns:
+            Function text -> list of matching celebrity names
+        """
+        rules = []  # (celebrity_name, first_name, last_name, last_name_alone_is_enough)
+        words = set()
+
+        for celebrity_name in celebrity_names:
+            name_parts = celebrity_name.lower().split()
+            if not name_parts:
+                continue
+
+            first_name, last_name = name_parts[0], name_parts[-1]
+            last_name_alone = len(name_parts) == 1 or (
+                len(last_name) > 4 and last_name not in COMMON_SURNAMES
+            )
+            rules.append((celebrity_name, first_name, last_name, last_name_alone))
+            words.update((first_name, last_name))
+
+        if not words:
+            return lambda text: []
+
+        pattern = re.compile(
+            r'(?<!\w)(?:' + '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)) + r')(?!\w)',
+            re.IGNORECASE
+        )
+
+        def matches(text: str) -> List[str]:
+            found = {m.group(0).lower() for m in pattern.finditer(text)}
+            if not found:
+                return []
+            return [
+                celebrity_name
+                for celebrity_name, first_name, last_name, last_name_alone in rules
+                if last_name in found and (last_name_alone or first_name in found)
+            ]
+
+        return matches
 
     def search_podcast_episodes(
         self,
@@ -106,90 +384,304 @@ class PodcastIngester:
             List of episode metadata dicts
         """
         if rss_feeds is None:
-            rss_feeds = self.POPULAR_PODCASTS
+            rss_feeds = self.default_feeds()
 
         logger.info(f"Searching podcasts for: {celebrity_name}")
 
+        name_matcher = self._build_name_matcher(celebrity_name)
         episodes = []
 
-        for feed_url in rss_feeds:
-            try:
-                logger.info(f"Checking feed: {feed_url}")
+        with closing(self._iter_feeds(rss_feeds)) as feeds:
+            for feed_url, feed in feeds:
+                try:
+                    episodes.extend(self._find_episodes_in_feed(
+                        feed,
+                        name_matcher,
+                        max_episodes - len(episodes)
+                    ))
+                except Exception as e:
+                    logger.error(f"Error parsing feed {feed_url}: {e}")
+                    continue
+
+                if len(episodes) >= max_episodes:
+                    break
 
-                # Add timeout and headers
-                feed = feedparser.parse(
-                    feed_url,
-                    request_headers={'User-Agent': 'Mozilla/5.0 (compatible; PodcastBot/1.0)'}
-                )
+        logger.info(f"Found {len(episodes)} relevant podcast episodes from RSS")
+        return episodes[:max_episodes]
 
-                if feed.bozo and not feed.entries:
-                    logger.warning(f"Feed error for {feed_url}: {feed.get('bozo_exception', 'Unknown error')}")
-                    continue
+    def search_podcast_episodes_batch(
+        self,
+        celebrity_names: List[str],
+        rss_feeds: Optional[List[str]] = None,
+        max_episodes: int = 5
+    ) -> Dict[str, List[Dict]]:
+        """
+        Search podcast episodes for several celebrities in one pass
+        Each feed is fetched once and each entry is scanned once for all names
+
+        Args:
+            celebrity_names: Names of the celebrities
+            rss_feeds: List of RSS feed URLs to search (if None, uses popular feeds)
+            max_episodes: Maximum number of episodes per celebrity
+
+        Returns:
+            Dict mapping celebrity name -> list of episode metadata dicts
+        """
+        if rss_feeds is None:
+            rss_feeds = self.default_feeds()
+
+        logger.info(f"Searching podcasts for {len(celebrity_names)} celebrities")
+
+        names_matcher = self._build_multi_name_matcher(celebrity_names)
+        results = {name: [] for name in celebrity_names}
 
-                podcast_title = feed.feed.get('title', 'Unknown Podcast')
-
-                for entry in feed.entries:
-                    # Check if celebrity is mentioned in title or description
-                    title = entry.get('title', '')
-                    description = entry.get('description', entry.get('summary', ''))
-                    combined_text = f"{title} {description}"
-
-                    if self._name_matches(celebrity_name, combined_text):
-                        # Find audio enclosure - try multiple approaches
-                        audio_url = None
-
-                        # Method 1: Standard enclosures
-                        for enclosure in entry.get('enclosures', []):
-                            enc_type = enclosure.get('type', '')
-                            if 'audio' in enc_type or enc_type.startswith('audio/'):
-                                audio_url = enclosure.get('href') or enclosure.get('url')
-                                break
-
-                        # Method 2: Check links for audio
-                        if not audio_url:
-                            for link in entry.get('links', []):
-                                if 'audio' in link.get('type', ''):
-                                    audio_url = link.get('href')
-                                    break
-
-                        # Method 3: Check media content
-                        if not audio_url:
-                            media_content = entry.get('media_content', [])
-                            for media in media_content:
-                                if 'audio' in media.get('type', ''):
-                                    audio_url = media.get('url')
-                                    break
-
-                        if not audio_url:
-                            logger.debug(f"No audio URL found for episode: {title[:50]}")
+        with closing(self._iter_feeds(rss_feeds)) as feeds:
+            for feed_url, feed in feeds:
+                try:
+                    podcast_title = feed.feed.get('title', 'Unknown Podcast')
+
+                    for entry in feed.entries[:MAX_ENTRIES_PER_FEED]:
+                        title = entry.get('title', '')
+                        description = entry.get('description', entry.get('summary', ''))
+
+                        matched = [
+                            name for name in names_matcher(f"{title}\n{description}")
+                            if len(results[name]) < max_episodes
+                        ]
+                        if not matched:
+                            continue
+
+                        episode_info = self._build_episode_info(entry, podcast_title)
+                        if episode_info is None:
                             continue
 
-                        # Extract metadata
-                        episode_info = {
-                            'title': entry.get('title'),
-                            'description': description[:500] if description else '',
-                            'audio_url': audio_url,
-                            'published': entry.get('published', entry.get('pubDate')),
-                            'podcast_title': podcast_title,
-                            'episode_url': entry.get('link'),
-                            'duration': entry.get('itunes_duration'),
-                        }
-
-                        episodes.append(episode_info)
-                        logger.info(f"  Found episode: {title[:60]}...")
-
-                        if len(episodes) >= max_episodes:
-                            break
-
-            except Exception as e:
-                logger.error(f"Error parsing feed {feed_url}: {e}")
+                        for name in matched:
+                            results[name].append(dict(episode_info))
+                            logger.info(f"  Found episode for {name}: {title[:60]}...")
+
+                except Exception as e:
+                    logger.error(f"Error parsing feed {feed_url}: {e}")
+                    continue
+
+                if all(len(episodes) >= max_episodes for episodes in results.values()):
+                    break
+
+        return results
+
+    def _iter_feeds(self, rss_feeds: List[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (feed_url, parsed feed) for every readable feed, in list order
+
+        Feeds are fetched concurrently (network-bound) but yielded in order,
+        so results stay deterministic and earlier feeds keep priority.
+        Closing the generator early cancels fetches that haven't started.
+        """
+        if not rss_feeds:
+            return
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(rss_feeds))) as executor:
+                futures = [executor.submit(self._fetch_feed, feed_url) for feed_url in rss_feeds]
+
+                try:
+                    for feed_url, future in zip(rss_feeds, futures):
+                        feed = future.result()
+                        if feed is not None:
+                            yield feed_url, feed
+                finally:
+                    for pending in futures:
+                        pending.cancel()
+        finally:
+            if self._feed_cache_dirty:
+                self._save_feed_cache()
+
+    def _load_feed_cache(self) -> Dict[str, Dict]:
+        """Load the conditional-GET feed cache from disk (empty if missing/corrupt)"""
+        if not os.path.exists(self.feed_cache_path):
+            return {}
+
+        try:
+            with open(self.feed_cache_path, 'rb') as f:
+                cache = pickle.load(f)
+            logger.info(f"Loaded feed cache with {len(cache)} feeds")
+            return cache
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.feed_cache_path}: {e}")
+            return {}
+
+    def _save_feed_cache(self):
+        """Persist the conditional-GET feed cache to disk"""
+        try:
+            # Write then rename so a crash mid-dump can't leave a truncated cache
+            tmp_path = f"{self.feed_cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._feed_cache, f)
+            os.replace(tmp_path, self.feed_cache_path)
+            self._feed_cache_dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save feed cache: {e}")
+
+    def _fetch_feed(self, feed_url: str):
+        """
+        Download and parse a single RSS feed
+
+        Returns:
+            Parsed feedparser result, or None if the feed could not be read
+        """
+        memo = self._parsed_feeds.get(feed_url)
+        if memo and memo[0] > time.monotonic():
+            return memo[1]
+
+        try:
+            logger.info(f"Checking feed: {feed_url}")
+
+            # Conditional GET: unchanged feeds answer 304 with an empty body
+            headers = dict(FEED_REQUEST_HEADERS)
+            cached = self._feed_cache.get(feed_url)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('modified'):
+                    headers['If-Modified-Since'] = cached['modified']
+
+            # Download with the pooled session (keep-alive, real timeout),
+            # then let feedparser work on the bytes only
+            response = self.session.get(feed_url, headers=headers, timeout=FEED_TIMEOUT_SECONDS)
+
+            if response.status_code == 304 and cached:
+                logger.info(f"Feed unchanged (304), using cached copy: {feed_url}")
+                content, response_headers = cached['content'], cached['headers']
+            else:
+                response.raise_for_status()
+                content, response_headers = response.content, dict(response.headers)
+
+                etag = response.headers.get('ETag')
+                modified = response.headers.get('Last-Modified')
+                if etag or modified:
+                    self._feed_cache[feed_url] = {
+                        'etag': etag,
+                        'modified': modified,
+                        'content': content,
+                        'headers': response_headers,
+                    }
+                    self._feed_cache_dirty = True
+
+            # Fast path for plain RSS; feedparser for Atom and malformed feeds
+            feed = parse_rss(content)
+            if feed is None:
+                feed = feedparser.parse(content, response_headers=response_headers)
+
+            if feed.bozo and not feed.entries:
+                logger.warning(f"Feed error for {feed_url}: {feed.get('bozo_exception', 'Unknown error')}")
+                return None
+
+            self._parsed_feeds[feed_url] = (time.monotonic() + self._feed_ttl_seconds(feed), feed)
+            return feed
+
+        except Exception as e:
+            logger.error(f"Error fetching feed {feed_url}: {e}")
+            return None
+
+    @staticmethod
+    def _feed_ttl_seconds(feed) -> int:
+        """How long a parsed feed may be reused: the feed's own <ttl> (minutes) if set, else the default"""
+        ttl = feed.feed.get('ttl')
+        if ttl and str(ttl).strip().isdigit():
+            return int(ttl) * 60
+        return FEED_MEMO_TTL_SECONDS
+
+    def _find_episodes_in_feed(
+        self,
+        feed,
+        name_matcher: Callable[[str], bool],
+        limit: int
+    ) -> List[Dict]:
+        """
+        Scan a parsed feed for episodes mentioning the celebrity
+
+        Args:
+            feed: Parsed feedparser result
+            name_matcher: Function from _build_name_matcher
+            limit: Maximum number of episodes to return
+
+        Returns:
+            List of episode metadata dicts (at most limit)
+        """
+        episodes = []
+        podcast_title = feed.feed.get('title', 'Unknown Podcast')
+
+        # Feeds list newest first; older back-catalogue entries rarely matter
+        for entry in feed.entries[:MAX_ENTRIES_PER_FEED]:
+            # Check if celebrity is mentioned in title or description
+            title = entry.get('title', '')
+            description = entry.get('description', entry.get('summary', ''))
+            # Single haystack per entry; separator stops matches spanning fields
+            haystack = f"{title}\n{description}"
+
+            if not name_matcher(haystack):
                 continue
 
-            if len(episodes) >= max_episodes:
+            episode_info = self._build_episode_info(entry, podcast_title)
+            if episode_info is None:
+                continue
+
+            episodes.append(episode_info)
+            logger.info(f"  Found episode: {title[:60]}...")
+
+            if len(episodes) >= limit:
                 break
 
-        logger.info(f"Found {len(episodes)} relevant podcast episodes from RSS")
-        return episodes[:max_episodes]
+        return episodes
+
+    def _build_episode_info(self, entry, podcast_title: str) -> Optional[Dict]:
+        """
+        Build the episode metadata dict for a feed entry
+
+        Returns:
+            Episode metadata dict, or None if the entry has no audio URL
+        """
+        title = entry.get('title', '')
+        description = entry.get('description', entry.get('summary', ''))
+
+        # Find audio enclosure - try multiple approaches
+        audio_url = None
+
+        # Method 1: Standard enclosures
+        for enclosure in entry.get('enclosures', []):
+            enc_type = enclosure.get('type', '')
+            if 'audio' in enc_type or enc_type.startswith('audio/'):
+                audio_url = enclosure.get('href') or enclosure.get('url')
+                break
+
+        # Method 2: Check links for audio
+        if not audio_url:
+            for link in entry.get('links', []):
+                if 'audio' in link.get('type', ''):
+                    audio_url = link.get('href')
+                    break
+
+        # Method 3: Check media content
+        if not audio_url:
+            media_content = entry.get('media_content', [])
+            for media in media_content:
+                if 'audio' in media.get('type', ''):
+                    audio_url = media.get('url')
+                    break
+
+        if not audio_url:
+            logger.debug(f"No audio URL found for episode: {title[:50]}")
+            return None
+
+        # Extract metadata
+        return {
+            'title': entry.get('title'),
+            'description': description[:500] if description else '',
+            'audio_url': audio_url,
+            'published': entry.get('published', entry.get('pubDate')),
+            'podcast_title': podcast_title,
+            'episode_url': entry.get('link'),
+            'duration': entry.get('itunes_duration'),
+        }
 
     def search_youtube_podcasts(
         self,
@@ -218,63 +710,46 @@ class PodcastIngester:
                 f"{celebrity_name} long form interview",
             ]
 
+            # Queries are independent network round trips: run them together,
+            # then merge in query order so results stay deterministic
+            with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+                query_results = list(executor.map(
+                    lambda query: self._youtube_search(yt_dlp, query, max_results),
+                    search_queries
+                ))
+
             episodes = []
             seen_urls = set()
 
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'force_generic_extractor': False,
-            }
-
-            for query in search_queries:
-                if len(episodes) >= max_results:
-                    break
-
-                try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        search_url = f"ytsearch{max_results}:{query}"
-                        result = ydl.extract_info(search_url, download=False)
-
-                        if not result or 'entries' not in result:
-                            continue
-
-                        for entry in result['entries']:
-                            if not entry:
-                                continue
-
-                            video_url = entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
+            for entries in query_results:
+                for entry in entries:
+                    if len(episodes) >= max_results:
+                        break
 
-                            if video_url in seen_urls:
-                                continue
-                            seen_urls.add(video_url)
+                    video_url = entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
 
-                            # Filter for longer videos (likely full interviews)
-                            duration = entry.get('duration', 0) or 0
-                            if duration < 300:  # Skip videos under 5 minutes
-                                continue
+                    if video_url in seen_urls:
+                        continue
+                    seen_urls.add(video_url)
 
-                            episode_info = {
-                                'title': entry.get('title', 'Unknown'),
-                                'description': entry.get('description', '')[:500],
-                                'audio_url': video_url,  # Will be processed by YouTube ingester
-                                'published': entry.get('upload_date'),
-                                'podcast_title': f"YouTube - {entry.get('uploader', 'Unknown Channel')}",
-                                'episode_url': video_url,
-                                'duration': duration,
-                                'source': 'youtube_fallback'
-                            }
+                    # Filter for longer videos (likely full interviews)
+                    duration = entry.get('duration', 0) or 0
+                    if duration < 300:  # Skip videos under 5 minutes
+                        continue
 
-                            episodes.append(episode_info)
-                            logger.info(f"  Found YouTube: {entry.get('title', '')[:60]}...")
+                    episode_info = {
+                        'title': entry.get('title', 'Unknown'),
+                        'description': (entry.get('description') or '')[:500],
+                        'audio_url': video_url,  # Will be processed by YouTube ingester
+                        'published': entry.get('upload_date'),
+                        'podcast_title': f"YouTube - {entry.get('uploader', 'Unknown Channel')}",
+                        'episode_url': video_url,
+                        'duration': duration,
+                        'source': 'youtube_fallback'
+                    }
 
-                            if len(episodes) >= max_results:
-                                break
-
-                except Exception as e:
-                    logger.debug(f"YouTube search query failed: {e}")
-                    continue
+                    episodes.append(episode_info)
+                    logger.info(f"  Found YouTube: {entry.get('title', '')[:60]}...")
 
             logger.info(f"YouTube fallback found {len(episodes)} podcast-style interviews")
             return episodes
@@ -286,6 +761,37 @@ class PodcastIngester:
             logger.error(f"YouTube fallback search failed: {e}")
             return []
 
+    def _youtube_search(self, yt_dlp, query: str, max_results: int) -> List[Dict]:
+        """
+        Run one flat yt-dlp search, memoized per (query, max_results) for an hour
+
+        Returns:
+            Raw (non-empty) yt-dlp search entries, or [] if the search failed
+        """
+        key = (query, max_results)
+        cached = self._youtube_search_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': True,
+            'force_generic_extractor': False,
+        }
+
+        try:
+            # One YoutubeDL per call: instances are not safe to share across threads
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                result = ydl.extract_info(f"ytsearch{max_results}:{query}", download=False)
+        except Exception as e:
+            logger.debug(f"YouTube search query failed: {e}")
+            return []
+
+        entries = [entry for entry in (result or {}).get('entries') or [] if entry]
+        self._youtube_search_cache[key] = (time.monotonic() + YOUTUBE_SEARCH_TTL_SECONDS, entries)
+        return entries
+
     def download_audio(
         self,
         audio_url: str,
@@ -301,34 +807,80 @@ class PodcastIngester:
         Returns:
             Path to downloaded audio file
         """
-        # Create safe filename from title
+        # Audio is stored by URL only, so a renamed episode still hits the cache;
+        # the title-based name is kept as a symlink for browsing
+        output_path = self._audio_store_path(audio_url)
         safe_title = "".join(c for c in episode_title if c.isalnum() or c in (' ', '-', '_'))[:50]
-        file_hash = hashlib.md5(audio_url.encode()).hexdigest()[:8]
-        filename = f"{safe_title}_{file_hash}.mp3"
-        output_path = os.path.join(self.download_dir, filename)
+        readable_path = os.path.join(self.download_dir, f"{safe_title}_{url_hash(audio_url)}.mp3")
 
         # Skip if already downloaded
         if os.path.exists(output_path):
             logger.info(f"Audio already exists: {output_path}")
             return output_path
 
+        # Adopt a file downloaded under the old title-based layout (whatever its title)
+        for legacy_path in glob.glob(os.path.join(self.download_dir, f"*_{url_hash(audio_url)}.mp3")):
+            if not os.path.islink(legacy_path):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                os.replace(legacy_path, output_path)
+                self._link_readable_name(output_path, readable_path)
+                logger.info(f"Audio already exists: {output_path}")
+                return output_path
+
         logger.info(f"Downloading podcast audio: {episode_title}")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        partial_path = f"{output_path}.part"
 
         try:
-            response = requests.get(audio_url, stream=True, timeout=30)
+            response = self.session.get(audio_url, stream=True, timeout=30)
             response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding while copying
+            response.raw.decode_content = True
+
+            # Write to a temp file so an interrupted download is never mistaken for a finished one
+            with open(partial_path, 'wb') as f:
+                content_length = response.headers.get('Content-Length')
+                if content_length and content_length.isdigit() and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, int(content_length))
+                    except OSError:
+                        pass  # Not supported on this filesystem
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_BUFFER_SIZE)
+                # Drop any preallocated tail if the body was shorter than advertised
+                f.truncate()
+
+            os.replace(partial_path, output_path)
+            self._link_readable_name(output_path, readable_path)
 
             logger.info(f"Downloaded: {output_path}")
             return output_path
 
         except Exception as e:
             logger.error(f"Error downloading audio: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
             return None
 
+    def _audio_store_path(self, audio_url: str) -> str:
+        """
+        Content-addressable location for an episode's audio
+        Keyed by a full-length hash of the URL, fanned out into 256 subdirectories
+        """
+        key = hashlib.blake2b(audio_url.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.download_dir, AUDIO_STORE_DIRNAME, key[:2], f"{key[2:]}.mp3")
+
+    def _link_readable_name(self, store_path: str, readable_path: str):
+        """Point a human-readable filename at a stored file (best effort)"""
+        try:
+            if os.path.islink(readable_path):
+                os.remove(readable_path)
+            elif os.path.exists(readable_path):
+                return
+            os.symlink(os.path.relpath(store_path, os.path.dirname(readable_path)), readable_path)
+        except OSError as e:
+            logger.debug(f"Could not link {readable_path}: {e}")
+
     def process_episode(
         self,
         episode_info: Dict,
@@ -344,61 +896,165 @@ class PodcastIngester:
         Returns:
             List of extracted questions with metadata
         """
-        episode_title = episode_info['title']
-        audio_url = episode_info['audio_url']
+        logger.info(f"Processing episode: {episode_info['title']}")
 
-        logger.info(f"Processing episode: {episode_title}")
-
-        # Step 1: Download audio
-        audio_path = self.download_audio(audio_url, episode_title)
+        audio_path = self._download_stage(episode_info)
         if not audio_path:
             return []
 
-        # Step 2: Transcribe (use chunking for long episodes)
+        transcript_data = self._transcribe_stage(episode_info, audio_path)
+        if transcript_data is None:
+            return []
+
+        return self._extract_stage(episode_info, transcript_data, celebrity_name)
+
+    def _download_stage(self, episode_info: Dict) -> Optional[str]:
+        """
+        Pipeline stage 1: fetch episode audio (network-bound)
+
+        Returns:
+            Path to the downloaded mp3, or None if the download failed
+        """
+        if episode_info.get('source') == 'youtube_fallback':
+            return self._download_youtube_audio(episode_info)
+        return self.download_audio(episode_info['audio_url'], episode_info['title'])
+
+    def _transcribe_stage(self, episode_info: Dict, audio_path: str) -> Optional[Dict]:
+        """
+        Pipeline stage 2: transcribe audio (GPU/CPU-bound, run one at a time)
+
+        Returns:
+            Transcript data from the transcriber, or None on failure
+        """
+        episode_title = episode_info['title']
+
+        # Use chunking for long episodes
         try:
-            logger.info(f"Transcribing podcast: {episode_title}")
-            transcript_data = self.transcriber.transcribe_with_chunking(
+            logger.info(f"Transcribing podcast: {episode_title[:60]}")
+            return self.transcriber.transcribe_with_chunking(
                 audio_path,
                 chunk_length_ms=300000  # 5 minutes
             )
 
         except Exception as e:
             logger.error(f"Error transcribing podcast: {e}")
-            return []
+            return None
+
+    def _extract_stage(
+        self,
+        episode_info: Dict,
+        transcript_data: Dict,
+        celebrity_name: str
+    ) -> List[Dict]:
+        """
+        Pipeline stage 3: extract questions and attach source metadata (LLM-bound)
+
+        Returns:
+            List of extracted questions with metadata
+        """
+        episode_title = episode_info['title']
 
-        # Step 3: Extract questions
         try:
-            logger.info(f"Extracting questions from: {episode_title}")
+            logger.info(f"Extracting questions from: {episode_title[:60]}")
             questions = self.question_extractor.extract_from_transcript(
                 transcript_data,
                 use_segments=True
             )
 
-            # Add source metadata
-            published = episode_info.get('published')
-            if published:
-                try:
-                    date_str = datetime.strptime(published, '%a, %d %b %Y %H:%M:%S %z').strftime('%Y-%m-%d')
-                except:
-                    date_str = published
-            else:
-                date_str = None
-
+            # Add source metadata (same fields for every question: build once, update in place)
+            source_fields = self._source_fields(episode_info, celebrity_name)
             for question in questions:
-                question['celebrity_name'] = celebrity_name
-                question['source_type'] = 'podcast'
-                question['source_url'] = episode_info.get('episode_url', audio_url)
-                question['source_title'] = f"{episode_info['podcast_title']} - {episode_title}"
-                question['date'] = date_str
-                question['podcast_title'] = episode_info['podcast_title']
-
-            logger.info(f"Extracted {len(questions)} questions from {episode_title}")
+                question.update(source_fields)
+
+            logger.info(f"Extracted {len(questions)} questions from {episode_title[:60]}")
             return questions
 
         except Exception as e:
             logger.error(f"Error extracting questions: {e}")
             return []
 
+    @staticmethod
+    def _source_fields(episode_info: Dict, celebrity_name: str) -> Dict:
+        """Source metadata shared by every question extracted from one episode"""
+        source_title = f"{episode_info['podcast_title']} - {episode_info['title']}"
+        published = episode_info.get('published')
+
+        if episode_info.get('source') == 'youtube_fallback':
+            return {
+                'celebrity_name': celebrity_name,
+                'source_type': 'youtube_podcast',
+                'source_url': episode_info['audio_url'],
+                'source_title': source_title,
+                'date': format_published_date(published) if published else None,
+            }
+
+        return {
+            'celebrity_name': celebrity_name,
+            'source_type': 'podcast',
+            'source_url': episode_info.get('episode_url', episode_info['audio_url']),
+            'source_title': source_title,
+            'date': format_published_date(published) if published else None,
+            'podcast_title': episode_info['podcast_title'],
+        }
+
+    def process_episodes_pipelined(
+        self,
+        episodes: List[Dict],
+        celebrity_name: str
+    ) -> List[Dict]:
+        """
+        Process several episodes as a 3-stage pipeline
+        Downloads run in parallel, transcription runs one episode at a time
+        as downloads finish (avoids GPU contention), and question extraction
+        for finished transcripts overlaps with the next transcription
+
+        Args:
+            episodes: Episode metadata dicts (RSS or YouTube fallback)
+            celebrity_name: Name of the celebrity
+
+        Returns:
+            All extracted questions, in episode order
+        """
+        if not episodes:
+            return []
+
+        results: List[List[Dict]] = [[] for _ in episodes]
+
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as download_pool, \
+                ThreadPoolExecutor(max_workers=MAX_EXTRACT_WORKERS) as extract_pool:
+            download_futures = {
+                download_pool.submit(self._download_stage, episode): idx
+                for idx, episode in enumerate(episodes)
+            }
+            extract_futures = {}
+
+            # Transcribe in download-completion order on this thread
+            for future in as_completed(download_futures):
+                idx = download_futures[future]
+                episode = episodes[idx]
+
+                try:
+                    audio_path = future.result()
+                except Exception as e:
+                    logger.error(f"Error downloading episode {episode['title'][:60]}: {e}")
+                    continue
+                if not audio_path:
+                    continue
+
+                logger.info(f"Processing episode {idx+1}/{len(episodes)}")
+                transcript_data = self._transcribe_stage(episode, audio_path)
+                if transcript_data is None:
+                    continue
+
+                extract_futures[idx] = extract_pool.submit(
+                    self._extract_stage, episode, transcript_data, celebrity_name
+                )
+
+            for idx, future in extract_futures.items():
+                results[idx] = future.result()
+
+        return [question for questions in results for question in questions]
+
     def ingest_from_feeds(
         self,
         celebrity_name: str,
@@ -436,39 +1092,22 @@ class PodcastIngester:
             logger.warning(f"No podcast episodes found for {celebrity_name} (RSS + YouTube)")
             return []
 
-        # Step 3: Process each episode
-        all_questions = []
-
-        for idx, episode in enumerate(episodes):
-            logger.info(f"Processing episode {idx+1}/{len(episodes)}")
-
-            # Handle YouTube fallback episodes differently
-            if episode.get('source') == 'youtube_fallback':
-                questions = self._process_youtube_episode(episode, celebrity_name)
-            else:
-                questions = self.process_episode(episode, celebrity_name)
-
-            all_questions.extend(questions)
+        # Step 3: Download, transcribe and extract as an overlapping pipeline
+        all_questions = self.process_episodes_pipelined(episodes, celebrity_name)
 
         logger.info(f"Podcast ingestion complete: {len(all_questions)} total questions from {len(episodes)} episodes")
 
         return all_questions
 
-    def _process_youtube_episode(
-        self,
-        episode_info: Dict,
-        celebrity_name: str
-    ) -> List[Dict]:
+    def _download_youtube_audio(self, episode_info: Dict) -> Optional[str]:
         """
-        Process a YouTube podcast episode
-        Downloads audio and extracts questions
+        Download a YouTube episode's audio as mp3 with yt-dlp
 
         Args:
             episode_info: Episode metadata from YouTube search
-            celebrity_name: Name of the celebrity
 
         Returns:
-            List of extracted questions
+            Path to the mp3, or None if the download failed
         """
         try:
             import yt_dlp
@@ -476,12 +1115,15 @@ class PodcastIngester:
             video_url = episode_info['audio_url']
             episode_title = episode_info['title']
 
-            logger.info(f"Processing YouTube episode: {episode_title[:60]}...")
-
             # Create safe filename
             safe_title = "".join(c for c in episode_title if c.isalnum() or c in (' ', '-', '_'))[:50]
-            file_hash = hashlib.md5(video_url.encode()).hexdigest()[:8]
+            file_hash = url_hash(video_url)
             output_path = os.path.join(self.download_dir, f"{safe_title}_{file_hash}")
+            audio_path = f"{output_path}.mp3"
+
+            if os.path.exists(audio_path):
+                logger.info(f"Audio already exists: {audio_path}")
+                return audio_path
 
             # Download audio with yt-dlp
             ydl_opts = {
@@ -499,48 +1141,27 @@ class PodcastIngester:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([video_url])
 
-            audio_path = f"{output_path}.mp3"
-
             if not os.path.exists(audio_path):
                 logger.error(f"Audio download failed for: {episode_title}")
-                return []
-
-            # Transcribe
-            logger.info(f"Transcribing YouTube podcast: {episode_title[:50]}...")
-            transcript_data = self.transcriber.transcribe_with_chunking(
-                audio_path,
-                chunk_length_ms=300000
-            )
-
-            # Extract questions
-            logger.info(f"Extracting questions from: {episode_title[:50]}...")
-            questions = self.question_extractor.extract_from_transcript(
-                transcript_data,
-                use_segments=True
-            )
+                return None
 
-            # Add metadata
-            for question in questions:
-                question['celebrity_name'] = celebrity_name
-                question['source_type'] = 'youtube_podcast'
-                question['source_url'] = video_url
-                question['source_title'] = f"{episode_info['podcast_title']} - {episode_title}"
-                question['date'] = episode_info.get('published')
-
-            logger.info(f"Extracted {len(questions)} questions from YouTube: {episode_title[:50]}")
-            return questions
+            return audio_path
 
         except ImportError:
             logger.error("yt-dlp not installed for YouTube processing")
-            return []
+            return None
         except Exception as e:
-            logger.error(f"Error processing YouTube episode: {e}")
-            return []
+            logger.error(f"Error downloading YouTube episode: {e}")
+            return None
+
+    def default_feeds(self) -> List[str]:
+        """Feeds searched when none are given: popular podcasts plus this instance's custom feeds"""
+        return list(self.POPULAR_PODCASTS) + list(self._custom_feeds)
 
     def add_custom_feed(self, feed_url: str):
-        """Add a custom RSS feed to search"""
-        if feed_url not in self.POPULAR_PODCASTS:
-            self.POPULAR_PODCASTS.append(feed_url)
+        """Add a custom RSS feed to search (this instance only)"""
+        if feed_url not in self._popular_set and feed_url not in self._custom_feeds:
+            self._custom_feeds[feed_url] = None
             logger.info(f"Added custom feed: {feed_url}")
 
     def cleanup_audio(self, audio_path: str):
@@ -6,15 +6,55 @@ Extracts audio, transcribes, and extracts questions
 
 import yt_dlp
 import os
-from typing import List, Dict, Optional
+import glob
+import gzip
+import hashlib
+import json
+import time
+from typing import List, Dict, Optional, Union, Iterator
+import asyncio
 import logging
-from datetime import datetime
-from transcription.whisper_transcriber import get_transcriber
-from processing.question_extractor import get_question_extractor
+import queue
+import subprocess
+import threading
+import numpy as np
+from contextlib import contextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whisper input sample rate for in-memory decoding (matches transcription.whisper_transcriber.SAMPLE_RATE,
+# kept here so importing this module doesn't load faster-whisper)
+SAMPLE_RATE = 16000
+
+# Question-extraction threads in the ingestion pipeline (LLM-bound)
+EXTRACT_WORKERS = 2
+
+# yt-dlp options per use; download instances get their outtmpl set per call
+YDL_OPTIONS = {
+    'search': {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': True,  # Don't download, just get metadata
+    },
+    # Keep YouTube's own audio container (m4a/webm): Whisper decodes it
+    # directly, so the ffmpeg re-encode to .wav is skipped entirely
+    'download': {
+        'format': 'bestaudio/best',
+        'quiet': True,
+        'no_warnings': True,
+    },
+}
+
+# How long cached YouTube search results stay valid (1 hour)
+SEARCH_CACHE_TTL_SECONDS = 60 * 60
+
+# yt-dlp temp files that are not finished downloads
+PARTIAL_DOWNLOAD_SUFFIXES = ('.part', '.ytdl', '.temp')
+
+# Items waiting between pipeline stages (backpressure: caps downloaded-but-untranscribed audio)
+PIPELINE_QUEUE_SIZE = 2
+
 
 class YouTubeIngester:
     """
@@ -22,13 +62,108 @@ class YouTubeIngester:
     Uses ytsearch to find relevant interviews
     """
 
-    def __init__(self, download_dir: str = "data/downloads/youtube"):
+    def __init__(
+        self,
+        download_dir: str = "data/downloads/youtube",
+        max_workers: int = 4,
+        keep_audio: bool = True,
+        cache_dir: str = "data/cache/youtube",
+        min_duration: int = 120
+    ):
         self.base_download_dir = download_dir
         os.makedirs(download_dir, exist_ok=True)
-        self.transcriber = get_transcriber()
-        # 🔴 CRITICAL: use_llm=True (NO LLM for extraction per constraints)
-        self.question_extractor = get_question_extractor(use_llm=True)
+        # Search results (short TTL) and transcripts (kept indefinitely, keyed by video_id)
+        self.cache_dir = cache_dir
+        self.transcript_cache_dir = os.path.join(cache_dir, "transcripts")
+        # True: keep downloaded audio on disk (reused across runs)
+        # False: decode the audio stream straight into memory, nothing written
+        self.keep_audio = keep_audio
+        # Videos processed at the same time (downloads/extraction overlap)
+        self.max_workers = max_workers
+        # Skip search hits shorter than this many seconds (clips/shorts give useless transcripts)
+        self.min_duration = min_duration
+        # Whisper model and question extractor load on first use (see properties below),
+        # so searching never imports faster-whisper
+        self._transcriber = None
+        self._question_extractor = None
+        self._transcribe_semaphore = None
+        self._transcribe_lock = threading.Lock()
         self.current_celebrity = None  # Track current celebrity for download paths
+        # Idle YoutubeDL instances by kind (see _ydl)
+        self._ydl_pool: Dict[str, List[yt_dlp.YoutubeDL]] = {kind: [] for kind in YDL_OPTIONS}
+        self._ydl_lock = threading.Lock()
+
+    @property
+    def transcriber(self):
+        """Whisper transcriber, imported and loaded on first access"""
+        if self._transcriber is None:
+            from transcription.whisper_transcriber import get_transcriber
+            self._transcriber = get_transcriber()
+        return self._transcriber
+
+    @property
+    def question_extractor(self):
+        """Question extractor, imported and created on first access"""
+        if self._question_extractor is None:
+            from processing.question_extractor import get_question_extractor
+            # 🔴 CRITICAL: use_llm=True (NO LLM for extraction per constraints)
+            self._question_extractor = get_question_extractor(use_llm=True)
+        return self._question_extractor
+
+    @property
+    def _transcribe_workers(self) -> int:
+        """
+        Concurrent transcriptions = Whisper model replicas (1 = no CPU/GPU contention)
+        Read from the same env var get_transcriber uses until the model is loaded,
+        so sizing the pipeline never loads Whisper
+        """
+        if self._transcriber is not None:
+            return getattr(self._transcriber, 'num_workers', 1)
+        return int(os.getenv("WHISPER_NUM_WORKERS", "1"))
+
+    @property
+    def _transcribe_slots(self) -> threading.BoundedSemaphore:
+        """Semaphore bounding concurrent transcriptions, one slot per Whisper replica"""
+        if self._transcribe_semaphore is None:
+            workers = self._transcribe_workers
+            with self._transcribe_lock:
+                if self._transcribe_semaphore is None:
+                    self._transcribe_semaphore = threading.BoundedSemaphore(workers)
+        return self._transcribe_semaphore
+
+    @contextmanager
+    def _ydl(self, kind: str) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Borrow a reusable YoutubeDL instance ('search' or 'download')
+        Building one loads every extractor, so instances are pooled per ingester;
+        they aren't thread-safe, so each is lent to one thread at a time
+        """
+        with self._ydl_lock:
+            pool = self._ydl_pool[kind]
+            ydl = pool.pop() if pool else None
+
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(YDL_OPTIONS[kind])
+
+        try:
+            yield ydl
+        finally:
+            with self._ydl_lock:
+                self._ydl_pool[kind].append(ydl)
+
+    def close(self):
+        """Close pooled yt-dlp instances"""
+        with self._ydl_lock:
+            for pool in self._ydl_pool.values():
+                for ydl in pool:
+                    ydl.close()
+                pool.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def search_videos(
         self,
@@ -47,16 +182,22 @@ class YouTubeIngester:
         """
         search_query = f"ytsearch{max_results}:{celebrity_name} interview podcast"
 
-        logger.info(f"Searching YouTube for: {celebrity_name}")
+        cache_key = hashlib.sha256(search_query.encode()).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"search_{cache_key}.json")
 
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,  # Don't download, just get metadata
-        }
+        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < SEARCH_CACHE_TTL_SECONDS:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    videos = json.load(f)
+                logger.info(f"Using cached YouTube search for: {celebrity_name} ({len(videos)} videos)")
+                return self._filter_videos(videos)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable search cache {cache_path}: {e}")
+
+        logger.info(f"Searching YouTube for: {celebrity_name}")
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl('search') as ydl:
                 result = ydl.extract_info(search_query, download=False)
 
                 if 'entries' not in result:
@@ -78,16 +219,54 @@ class YouTubeIngester:
                         videos.append(video_info)
 
                 logger.info(f"Found {len(videos)} videos")
-                return videos
+
+            if videos:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    with open(cache_path, 'w', encoding='utf-8') as f:
+                        json.dump(videos, f)
+                except OSError as e:
+                    logger.debug(f"Could not write search cache {cache_path}: {e}")
+
+            return self._filter_videos(videos)
 
         except Exception as e:
             logger.error(f"Error searching YouTube: {e}")
             return []
 
+    def _filter_videos(self, videos: List[Dict]) -> List[Dict]:
+        """
+        Drop duplicate search hits (same video_id) and videos shorter than min_duration
+        Videos whose duration yt-dlp didn't report are kept
+
+        Args:
+            videos: Video metadata dicts from search_videos
+
+        Returns:
+            Filtered list, in search order
+        """
+        seen = set()
+        kept = []
+        for video in videos:
+            video_id = video['video_id']
+            if video_id in seen:
+                continue
+            seen.add(video_id)
+
+            duration = video.get('duration')
+            if duration is not None and duration < self.min_duration:
+                continue
+            kept.append(video)
+
+        if len(kept) < len(videos):
+            logger.info(f"Skipped {len(videos) - len(kept)} duplicate or short (<{self.min_duration}s) videos")
+        return kept
+
     def download_audio(
         self,
         video_url: str,
-        video_id: str
+        video_id: str,
+        celebrity_name: Optional[str] = None
     ) -> Optional[str]:
         """
         Download audio from YouTube video
@@ -95,35 +274,29 @@ class YouTubeIngester:
         Args:
             video_url: URL of the video
             video_id: Video ID for naming
+            celebrity_name: Celebrity whose download directory to use
+                            (default: the one set by ingest_celebrity)
 
         Returns:
             Path to downloaded audio file, or None if failed
         """
         # Use celebrity-specific subdirectory
-        download_dir = self._get_celebrity_download_dir()
-        output_path = os.path.join(download_dir, f"{video_id}.wav")
+        download_dir = self._get_celebrity_download_dir(celebrity_name)
 
         # Skip if already downloaded
-        if os.path.exists(output_path):
-            logger.info(f"Audio already exists: {output_path}")
-            return output_path
+        existing_path = self._find_downloaded_audio(download_dir, video_id)
+        if existing_path:
+            logger.info(f"Audio already exists: {existing_path}")
+            return existing_path
 
         logger.info(f"Downloading audio: {video_id}")
 
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-            }],
-            'outtmpl': os.path.join(download_dir, f"{video_id}.%(ext)s"),
-            'quiet': True,
-            'no_warnings': True,
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+            with self._ydl('download') as ydl:
+                # Output location varies per call (celebrity dir + video id)
+                ydl.params['outtmpl'] = {'default': os.path.join(download_dir, f"{video_id}.%(ext)s")}
+                info = ydl.extract_info(video_url, download=True)
+                output_path = ydl.prepare_filename(info)
 
             if os.path.exists(output_path):
                 logger.info(f"Audio downloaded: {output_path}")
@@ -136,6 +309,60 @@ class YouTubeIngester:
             logger.error(f"Error downloading audio: {e}")
             return None
 
+    @staticmethod
+    def _find_downloaded_audio(download_dir: str, video_id: str) -> Optional[str]:
+        """Find a finished download for a video (.wav from older runs, or the native container)"""
+        wav_path = os.path.join(download_dir, f"{video_id}.wav")
+        if os.path.exists(wav_path):
+            return wav_path
+
+        for path in glob.glob(os.path.join(download_dir, f"{glob.escape(video_id)}.*")):
+            if not path.endswith(PARTIAL_DOWNLOAD_SUFFIXES):
+                return path
+
+        return None
+
+    def download_audio_to_array(self, video_url: str) -> Optional[np.ndarray]:
+        """
+        Decode a video's audio stream straight into memory
+        yt-dlp only resolves the direct stream URL; ffmpeg decodes it to
+        16 kHz mono float32 on a pipe, so no audio file is written or re-read
+
+        Args:
+            video_url: URL of the video
+
+        Returns:
+            Float32 samples at 16 kHz, or None if failed
+        """
+        try:
+            with self._ydl('download') as ydl:
+                info = ydl.extract_info(video_url, download=False)
+
+            command = ['ffmpeg', '-nostdin', '-v', 'error']
+            # Stream URLs can require the same headers yt-dlp used (User-Agent, cookies)
+            headers = info.get('http_headers') or {}
+            if headers:
+                command += ['-headers', ''.join(f"{k}: {v}\r\n" for k, v in headers.items())]
+            command += ['-i', info['url'], '-f', 'f32le', '-ac', '1', '-ar', str(SAMPLE_RATE), 'pipe:1']
+
+            logger.info(f"Streaming audio: {video_url}")
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+
+            audio = np.frombuffer(result.stdout, dtype=np.float32)
+            if audio.size == 0:
+                logger.error(f"No audio decoded from: {video_url}")
+                return None
+
+            logger.info(f"Audio decoded in memory: {audio.size / SAMPLE_RATE:.2f}s")
+            return audio
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"ffmpeg failed decoding audio: {e.stderr.decode(errors='replace')[:200]}")
+            return None
+        except Exception as e:
+            logger.error(f"Error streaming audio: {e}")
+            return None
+
     def process_video(
         self,
         video_info: Dict,
@@ -151,33 +378,99 @@ class YouTubeIngester:
         Returns:
             List of extracted questions with metadata
         """
-        video_id = video_info['video_id']
-        video_url = video_info['url']
-        video_title = video_info['title']
+        logger.info(f"Processing video: {video_info['title']}")
 
-        logger.info(f"Processing video: {video_title}")
+        # Already transcribed in an earlier run: skip download + Whisper
+        transcript_data = self._load_transcript(video_info['video_id'])
+        if transcript_data is not None:
+            return self._extract_stage(video_info, transcript_data, celebrity_name)
+
+        audio = self._download_stage(video_info, celebrity_name)
+        if audio is None:
+            return []
 
-        # Step 1: Download audio
-        audio_path = self.download_audio(video_url, video_id)
-        if not audio_path:
+        transcript_data = self._transcribe_stage(video_info, audio)
+        if transcript_data is None:
             return []
 
-        # Step 2: Transcribe
+        return self._extract_stage(video_info, transcript_data, celebrity_name)
+
+    def _download_stage(
+        self,
+        video_info: Dict,
+        celebrity_name: Optional[str] = None
+    ) -> Union[str, np.ndarray, None]:
+        """Pipeline stage 1: download audio (network-bound), to disk or memory per keep_audio"""
+        if not self.keep_audio:
+            return self.download_audio_to_array(video_info['url'])
+        return self.download_audio(video_info['url'], video_info['video_id'], celebrity_name)
+
+    def _transcribe_stage(self, video_info: Dict, audio: Union[str, np.ndarray]) -> Optional[Dict]:
+        """Pipeline stage 2: transcribe audio (CPU/GPU-bound, one per Whisper worker)"""
+        video_id = video_info['video_id']
+
         try:
             logger.info(f"Transcribing video: {video_id}")
 
-            # Use chunking for long videos (>30 minutes)
-            duration = video_info.get('duration', 0)
-            if duration > 1800:  # 30 minutes
-                transcript_data = self.transcriber.transcribe_with_chunking(audio_path)
-            else:
-                transcript_data = self.transcriber.transcribe_audio(audio_path)
+            with self._transcribe_slots:
+                # In-memory audio needs no file chunking: Whisper windows it itself
+                if isinstance(audio, np.ndarray):
+                    transcript_data = self.transcriber.transcribe_audio(audio)
+                # Use chunking for long videos (>30 minutes)
+                elif (video_info.get('duration') or 0) > 1800:  # 30 minutes
+                    transcript_data = self.transcriber.transcribe_with_chunking(audio)
+                else:
+                    transcript_data = self.transcriber.transcribe_audio(audio)
+
+            self._save_transcript(video_id, transcript_data)
+            return transcript_data
 
         except Exception as e:
             logger.error(f"Error transcribing video: {e}")
-            return []
+            return None
+
+    def _transcript_cache_path(self, video_id: str) -> str:
+        return os.path.join(self.transcript_cache_dir, f"{video_id}.json.gz")
+
+    def _load_transcript(self, video_id: str) -> Optional[Dict]:
+        """Load a cached transcript for a video (None if missing/unreadable)"""
+        cache_path = self._transcript_cache_path(video_id)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                transcript_data = json.load(f)
+            logger.info(f"Using cached transcript: {video_id}")
+            return transcript_data
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable transcript cache {cache_path}: {e}")
+            return None
+
+    def _save_transcript(self, video_id: str, transcript_data: Dict):
+        """Cache a transcript (gzip JSON, written atomically)"""
+        cache_path = self._transcript_cache_path(video_id)
+        temp_path = f"{cache_path}.tmp"
+
+        try:
+            os.makedirs(self.transcript_cache_dir, exist_ok=True)
+            with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+                json.dump(transcript_data, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write transcript cache {cache_path}: {e}")
+
+    def _extract_stage(
+        self,
+        video_info: Dict,
+        transcript_data: Dict,
+        celebrity_name: str
+    ) -> List[Dict]:
+        """Pipeline stage 3: extract questions and attach source metadata (LLM-bound)"""
+        video_id = video_info['video_id']
+        video_url = video_info['url']
+        video_title = video_info['title']
 
-        # Step 3: Extract questions
         try:
             logger.info(f"Extracting questions from: {video_id}")
             questions = self.question_extractor.extract_from_transcript(
@@ -187,18 +480,19 @@ class YouTubeIngester:
 
             # Add source metadata
             upload_date = video_info.get('upload_date')
-            if upload_date:
-                try:
-                    date_str = datetime.strptime(upload_date, '%Y%m%d').strftime('%Y-%m-%d')
-                except:
-                    date_str = upload_date
+            if upload_date and len(upload_date) == 8 and upload_date.isdigit():
+                # yt-dlp gives YYYYMMDD; fixed-width slice instead of strptime
+                date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
             else:
-                date_str = None
+                date_str = upload_date or None
+
+            # Class-level URL helper: cached-transcript hits never load the Whisper model
+            from transcription.whisper_transcriber import WhisperTranscriber
 
             for question in questions:
                 question['celebrity_name'] = celebrity_name
                 question['source_type'] = 'youtube'
-                question['source_url'] = self.transcriber.get_timestamped_url(
+                question['source_url'] = WhisperTranscriber.get_timestamped_url(
                     video_url,
                     question.get('timestamp', 0),
                     'youtube'
@@ -214,13 +508,101 @@ class YouTubeIngester:
             logger.error(f"Error extracting questions: {e}")
             return []
 
-    def _get_celebrity_download_dir(self) -> str:
-        """Get celebrity-specific download directory"""
-        if not self.current_celebrity:
+    def _run_pipeline(self, videos: List[Dict], celebrity_name: str) -> List[Dict]:
+        """
+        Process videos as a 3-stage producer/consumer pipeline
+        Download threads -> transcribe_q -> transcription thread -> extract_q -> extraction threads,
+        so the network, Whisper and the LLM are all busy at once. Bounded queues stop
+        downloads from running far ahead of transcription (disk usage)
+
+        Args:
+            videos: Video metadata dicts
+            celebrity_name: Name of the celebrity
+
+        Returns:
+            All extracted questions, in search order
+        """
+        results: List[List[Dict]] = [[] for _ in videos]
+
+        download_q: queue.Queue = queue.Queue()
+        transcribe_q: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        extract_q: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+        for item in enumerate(videos):
+            download_q.put(item)
+
+        def download_worker():
+            while True:
+                try:
+                    idx, video = download_q.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    # Cached transcript: straight to extraction
+                    transcript_data = self._load_transcript(video['video_id'])
+                    if transcript_data is not None:
+                        extract_q.put((idx, video, transcript_data))
+                        continue
+
+                    audio = self._download_stage(video, celebrity_name)
+                    if audio is not None:
+                        transcribe_q.put((idx, video, audio))
+                except Exception as e:
+                    logger.error(f"Error downloading video {idx+1}/{len(videos)}: {e}")
+
+        def transcribe_worker():
+            # None is the shutdown sentinel
+            while (item := transcribe_q.get()) is not None:
+                idx, video, audio = item
+                logger.info(f"Processing video {idx+1}/{len(videos)}")
+                transcript_data = self._transcribe_stage(video, audio)
+                if transcript_data is not None:
+                    extract_q.put((idx, video, transcript_data))
+
+        def extract_worker():
+            while (item := extract_q.get()) is not None:
+                idx, video, transcript_data = item
+                # Each index is written by exactly one worker: no lock needed
+                results[idx] = self._extract_stage(video, transcript_data, celebrity_name)
+
+        def start(target, count: int) -> List[threading.Thread]:
+            threads = [threading.Thread(target=target, daemon=True) for _ in range(count)]
+            for thread in threads:
+                thread.start()
+            return threads
+
+        downloaders = start(download_worker, min(self.max_workers, len(videos)))
+        transcribers = start(transcribe_worker, self._transcribe_workers)
+        extractors = start(extract_worker, EXTRACT_WORKERS)
+
+        # Shut down stage by stage once the stage feeding it is done
+        for thread in downloaders:
+            thread.join()
+        for _ in transcribers:
+            transcribe_q.put(None)
+        for thread in transcribers:
+            thread.join()
+        for _ in extractors:
+            extract_q.put(None)
+        for thread in extractors:
+            thread.join()
+
+        return [question for questions in results for question in questions]
+
+    def _get_celebrity_download_dir(self, celebrity_name: Optional[str] = None) -> str:
+        """
+        Get celebrity-specific download directory
+
+        Args:
+            celebrity_name: Celebrity to use (default: current_celebrity). Pass it
+                            explicitly when several celebrities are ingested at once
+        """
+        celebrity_name = celebrity_name or self.current_celebrity
+        if not celebrity_name:
             return self.base_download_dir
-        
+
         # Create slug from celebrity name
-        celebrity_slug = self.current_celebrity.lower().replace(' ', '_')
+        celebrity_slug = celebrity_name.lower().replace(' ', '_')
         celebrity_dir = os.path.join(self.base_download_dir, celebrity_slug)
         os.makedirs(celebrity_dir, exist_ok=True)
         return celebrity_dir
@@ -251,23 +633,116 @@ class YouTubeIngester:
             logger.warning(f"No videos found for {celebrity_name}")
             return []
 
-        # Step 2: Process each video
-        all_questions = []
+        # Step 2: Download, transcribe and extract as an overlapping pipeline
+        logger.info(f"Processing {len(videos)} videos ({self.max_workers} downloads at a time)")
+        all_questions = self._run_pipeline(videos, celebrity_name)
+
+        logger.info(f"YouTube ingestion complete: {len(all_questions)} total questions from {len(videos)} videos")
+
+        return all_questions
+
+    async def search_videos_async(
+        self,
+        celebrity_name: str,
+        max_results: int = 10
+    ) -> List[Dict]:
+        """Async variant of search_videos (runs the blocking yt-dlp search in a thread)"""
+        return await asyncio.to_thread(self.search_videos, celebrity_name, max_results)
+
+    async def download_audio_async(
+        self,
+        video_url: str,
+        video_id: str,
+        celebrity_name: Optional[str] = None
+    ) -> Optional[str]:
+        """Async variant of download_audio (runs the blocking yt-dlp download in a thread)"""
+        return await asyncio.to_thread(self.download_audio, video_url, video_id, celebrity_name)
+
+    async def ingest_celebrity_async(
+        self,
+        celebrity_name: str,
+        max_videos: int = 10,
+        concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Async variant of ingest_celebrity for callers already inside an event loop
+        Lets several celebrities be ingested concurrently from one loop (the
+        celebrity is passed down explicitly, never read from current_celebrity)
+
+        Args:
+            celebrity_name: Name of the celebrity
+            max_videos: Maximum number of videos to process
+            concurrency: Videos in flight at once (defaults to max_workers)
+
+        Returns:
+            List of all extracted questions (in search order)
+        """
+        logger.info(f"Starting YouTube ingestion for: {celebrity_name}")
+
+        videos = await self.search_videos_async(celebrity_name, max_videos)
+
+        if not videos:
+            logger.warning(f"No videos found for {celebrity_name}")
+            return []
+
+        semaphore = asyncio.Semaphore(concurrency or self.max_workers)
 
-        for idx, video in enumerate(videos):
-            logger.info(f"Processing video {idx+1}/{len(videos)}")
-            questions = self.process_video(video, celebrity_name)
-            all_questions.extend(questions)
+        async def process(idx: int, video: Dict) -> List[Dict]:
+            async with semaphore:
+                try:
+                    return await self._process_video_async(video, celebrity_name)
+                except Exception as e:
+                    # Don't let one video fail the whole gather
+                    logger.error(f"Error processing video {idx+1}/{len(videos)}: {e}")
+                    return []
+
+        results = await asyncio.gather(
+            *(process(idx, video) for idx, video in enumerate(videos)),
+            return_exceptions=False
+        )
+
+        all_questions = [question for questions in results for question in questions]
 
         logger.info(f"YouTube ingestion complete: {len(all_questions)} total questions from {len(videos)} videos")
 
         return all_questions
 
-    def cleanup_audio(self, video_id: str):
+    async def _process_video_async(self, video_info: Dict, celebrity_name: str) -> List[Dict]:
+        """Async process_video: download and transcription are awaited, extraction runs in a thread"""
+        transcript_data = await asyncio.to_thread(self._load_transcript, video_info['video_id'])
+        if transcript_data is not None:
+            return await asyncio.to_thread(self._extract_stage, video_info, transcript_data, celebrity_name)
+
+        audio = await asyncio.to_thread(self._download_stage, video_info, celebrity_name)
+        if audio is None:
+            return []
+
+        # Share the sync pipeline's slots so async ingests don't oversubscribe Whisper;
+        # acquire in a thread so waiting for a slot doesn't block the event loop
+        slots = self._transcribe_slots
+        await asyncio.to_thread(slots.acquire)
+        try:
+            logger.info(f"Transcribing video: {video_info['video_id']}")
+            # Use chunking for long videos (>30 minutes) that live on disk
+            long_file = not isinstance(audio, np.ndarray) and (video_info.get('duration') or 0) > 1800
+            transcript_data = await self.transcriber.transcribe_audio_async(
+                audio,
+                chunk_length_ms=300000 if long_file else None
+            )
+        except Exception as e:
+            logger.error(f"Error transcribing video: {e}")
+            return []
+        finally:
+            slots.release()
+
+        self._save_transcript(video_info['video_id'], transcript_data)
+        return await asyncio.to_thread(self._extract_stage, video_info, transcript_data, celebrity_name)
+
+    def cleanup_audio(self, video_id: str, celebrity_name: Optional[str] = None):
         """Delete downloaded audio file to save space"""
-        download_dir = self._get_celebrity_download_dir()
-        audio_path = os.path.join(download_dir, f"{video_id}.wav")
-        if os.path.exists(audio_path):
+        download_dir = self._get_celebrity_download_dir(celebrity_name)
+        audio_path = self._find_downloaded_audio(download_dir, video_id)
+        if audio_path:
             os.remove(audio_path)
             logger.info(f"Cleaned up audio: {video_id}")
 
@@ -7,12 +7,50 @@ Uses LLM ONLY for explanation and formatting, NOT for inventing answers
 """
 
 import os
+from collections import Counter
+from statistics import fmean
 from typing import List, Dict, Optional
 from utils.logger import get_logger
 from utils.llm_cost_tracker import get_claude_client, get_cost_tracker
 
 logger = get_logger(__name__)
 
+# Reply when retrieval finds nothing (deterministic, no LLM round-trip)
+NO_RESULTS_MESSAGE = (
+    "I couldn't find any indexed interviews where {celebrity} was asked this question. "
+    "It may not have come up in the interviews available to us, or we haven't indexed those sources yet. "
+    "Try rephrasing it or asking a related question."
+)
+
+# Static formatting instructions (sent as the system message, not repeated in each prompt)
+SYSTEM_PROMPT = """You are a precise assistant that presents interview question search results without adding information.
+
+Each match is given on one line as: question | source title (type) | date | link
+
+Instructions:
+1. Summarize how many interviews were found where the celebrity was asked similar questions
+2. For each match, present:
+   - The exact question asked
+   - Source information (title, type, date)
+   - Clickable link
+3. DO NOT invent answers or information not provided
+4. DO NOT speculate about what the celebrity might have said
+5. Keep response concise and well-formatted
+
+Format the response in a clear, user-friendly way with proper markdown formatting."""
+
+# Per-call prompt: only the facts, filled in with str.format
+PROMPT_TEMPLATE = """User Query: "{query}"
+Celebrity: {celebrity}
+Matches ({count}):
+{matches_text}{insights}"""
+
+# Appended to the prompt when several matches can be compared
+INSIGHTS_CLAUSE = "\n\nNote any interesting patterns across sources (e.g., commonly asked, asked at different times)."
+
+# Upper bound on the formatted answer length
+ANSWER_MAX_TOKENS = 400
+
 
 class AnswerGenerator:
     """
@@ -20,12 +58,19 @@ class AnswerGenerator:
     LLM is used ONLY for formatting, NOT for content generation
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, llm_no_results_message: bool = False):
         """
         Initialize answer generator with Qwen LLM
 
         🔄 UPDATED: Uses Qwen 2.5 3B Instruct via Ollama with cost tracking
+
+        Args:
+            llm_no_results_message: If True, have the LLM word the "no results" reply
+                                    (default: fixed template, no LLM call)
         """
+        self.llm_no_results_message = llm_no_results_message
+        self._system_prompt = SYSTEM_PROMPT
+        self._prompt_template = PROMPT_TEMPLATE
         self.client = get_claude_client()
         self.cost_tracker = get_cost_tracker()
         logger.info("✅ Answer generator initialized (Qwen LLM with cost tracking)")
@@ -48,18 +93,20 @@ class AnswerGenerator:
         if count == 0:
             return f"No interviews found where {celebrity} was asked a similar question."
 
-        response = f"Found {count} interview{'s' if count > 1 else ''} where {celebrity} was asked this question:\n\n"
+        parts = [f"Found {count} interview{'s' if count > 1 else ''} where {celebrity} was asked this question:\n\n"]
 
         for idx, match in enumerate(matches, 1):
-            response += f"{idx}. \"{match['question_text']}\"\n"
-            response += f"   Source: {match['source_title']}\n"
-            response += f"   Type: {match['source_type'].capitalize()}\n"
-            if match['date']:
-                response += f"   Date: {match['date']}\n"
-            response += f"   Link: {match['source_url']}\n"
-            response += f"   Similarity: {match['similarity_score']:.2%}\n\n"
+            date_line = f"   Date: {match['date']}\n" if match['date'] else ""
+            parts.append(
+                f"{idx}. \"{match['question_text']}\"\n"
+                f"   Source: {match['source_title']}\n"
+                f"   Type: {match['source_type'].capitalize()}\n"
+                f"{date_line}"
+                f"   Link: {match['source_url']}\n"
+                f"   Similarity: {match['similarity_score']:.2%}\n\n"
+            )
 
-        return response
+        return "".join(parts)
 
     def generate_natural_response(
         self,
@@ -87,43 +134,26 @@ class AnswerGenerator:
             return self._generate_no_results_message(celebrity, query)
 
         # Build context for LLM
-        matches_text = ""
-        for idx, match in enumerate(matches, 1):
-            matches_text += f"\nMatch {idx}:\n"
-            matches_text += f"Question: {match['question_text']}\n"
-            matches_text += f"Source: {match['source_title']} ({match['source_type']})\n"
-            matches_text += f"Date: {match.get('date', 'Unknown')}\n"
-            matches_text += f"URL: {match['source_url']}\n"
-            matches_text += f"Similarity: {match['similarity_score']:.2%}\n"
-
-        # Create prompt
-        prompt = f"""You are a helpful assistant that presents interview question search results.
-
-User Query: "{query}"
-Celebrity: {celebrity}
-Number of Matches: {count}
-
-Matching Questions Found:
-{matches_text}
-
-Instructions:
-1. Summarize that we found {count} interview{'s' if count > 1 else ''} where {celebrity} was asked similar questions
-2. For each match, present:
-   - The exact question asked
-   - Source information (title, type, date)
-   - Clickable link
-3. {"If multiple sources, note any interesting patterns (e.g., commonly asked, asked at different times)" if include_insights and count > 1 else ""}
-4. DO NOT invent answers or information not provided
-5. DO NOT speculate about what the celebrity might have said
-6. Keep response concise and well-formatted
-
-Format the response in a clear, user-friendly way with proper markdown formatting."""
+        matches_text = "\n".join(
+            f"{idx}. {match['question_text']} | {match['source_title']} ({match['source_type']}) | "
+            f"{match.get('date') or 'Unknown'} | {match['source_url']}"
+            for idx, match in enumerate(matches, 1)
+        )
+
+        # Create prompt (facts only; instructions live in the system prompt)
+        prompt = self._prompt_template.format(
+            query=query,
+            celebrity=celebrity,
+            count=count,
+            matches_text=matches_text,
+            insights=INSIGHTS_CLAUSE if include_insights and count > 1 else ""
+        )
 
         try:
             answer = self.client.generate(
                 prompt=prompt,
-                system="You are a precise assistant that presents search results without adding information.",
-                max_tokens=1000,
+                system=self._system_prompt,
+                max_tokens=ANSWER_MAX_TOKENS,
                 temperature=0.3,
                 purpose="format_retrieval_results"
             )
@@ -142,6 +172,8 @@ Format the response in a clear, user-friendly way with proper markdown formattin
         query: str
     ) -> str:
         """Generate a helpful message when no results found"""
+        if not self.llm_no_results_message:
+            return NO_RESULTS_MESSAGE.format(celebrity=celebrity)
 
         prompt = f"""User asked: "{query}"
 Celebrity: {celebrity}
@@ -168,7 +200,7 @@ Keep it concise and friendly."""
 
         except Exception as e:
             logger.error(f"Error generating no-results message: {e}")
-            return f"No interviews found where {celebrity} was asked a similar question. Try rephrasing your question or asking something related."
+            return NO_RESULTS_MESSAGE.format(celebrity=celebrity)
 
     def generate_summary(self, retrieval_result: Dict) -> Dict:
         """
@@ -187,28 +219,26 @@ Keep it concise and friendly."""
             }
 
         # Group by source type
-        source_types = {}
-        dates = []
-        avg_similarity = 0
+        source_types = Counter(match['source_type'] for match in matches)
+        avg_similarity = fmean(match['similarity_score'] for match in matches)
 
+        # Date range in one pass
+        earliest = latest = None
         for match in matches:
-            source_type = match['source_type']
-            source_types[source_type] = source_types.get(source_type, 0) + 1
-
-            if match['date']:
-                dates.append(match['date'])
-
-            avg_similarity += match['similarity_score']
-
-        avg_similarity /= count
+            date = match['date']
+            if date:
+                if earliest is None or date < earliest:
+                    earliest = date
+                if latest is None or date > latest:
+                    latest = date
 
         return {
             'total_matches': count,
             'average_similarity': avg_similarity,
-            'source_types': source_types,
+            'source_types': dict(source_types),
             'date_range': {
-                'earliest': min(dates) if dates else None,
-                'latest': max(dates) if dates else None
+                'earliest': earliest,
+                'latest': latest
             },
             'top_match_similarity': matches[0]['similarity_score']
         }
@@ -4,16 +4,23 @@ Main entry point with CLI interface
 """
 
 # Fix for segmentation fault on Mac with Python 3.13 - MUST be before any imports
+# Single-threaded BLAS/OpenMP costs Whisper and embedding throughput, so the cap is
+# only applied where the crash happens; elsewhere the libraries use all cores
+# (set OMP_NUM_THREADS yourself to leave room for other work)
 import os
-os.environ["OMP_NUM_THREADS"] = "1"
-os.environ["MKL_NUM_THREADS"] = "1"
-os.environ["NUMEXPR_NUM_THREADS"] = "1"
-os.environ["OPENBLAS_NUM_THREADS"] = "1"
-os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
+import sys
+if sys.platform == "darwin" and sys.version_info >= (3, 13):
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["MKL_NUM_THREADS"] = "1"
+    os.environ["NUMEXPR_NUM_THREADS"] = "1"
+    os.environ["OPENBLAS_NUM_THREADS"] = "1"
+    os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
 import argparse
-import sys
+import threading
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from agent.graph import CelebrityQuestionGraph
 import logging
@@ -28,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent celebrities in batch mode (queries for one celebrity stay serial)
+BATCH_MAX_WORKERS = 5
+
 
 def check_api_key():
     """Check if Claude API key is set"""
@@ -98,6 +108,81 @@ def run_query(celebrity: str, question: str, force_ingest: bool = False):
     print("\n")
 
 
+def parse_batch_file(path: str) -> List[Tuple[int, str, str]]:
+    """
+    Read a whole batch file (one "celebrity|question" per line) in one go
+
+    Args:
+        path: Batch file path; blank lines and '#' comments are skipped
+
+    Returns:
+        (line_num, celebrity, question) tuples, in file order
+    """
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()
+
+    queries = []
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        # Expected format: celebrity|question
+        celebrity, sep, question = line.partition('|')
+        if not sep:
+            print(f"Error on line {line_num}: Invalid format (expected: celebrity|question)")
+            continue
+        queries.append((line_num, celebrity.strip(), question.strip()))
+
+    return queries
+
+
+def run_batch(queries: List[Tuple[int, str, str]], max_workers: int = BATCH_MAX_WORKERS):
+    """
+    Run batch queries concurrently, one celebrity per worker
+
+    Each worker thread gets its own CelebrityQuestionGraph (the ingesters and
+    index managers keep per-instance state), and a celebrity's queries run in
+    order on a single worker so ingestion and indexing for the same celebrity
+    never overlap.
+
+    Args:
+        queries: (line_num, celebrity, question) tuples
+        max_workers: Maximum number of celebrities processed at once
+    """
+    by_celebrity: Dict[str, List[Tuple[int, str, str]]] = {}
+    for query in queries:
+        by_celebrity.setdefault(query[1].lower(), []).append(query)
+
+    local = threading.local()
+    # Build graphs one at a time so the shared get_*() singletons are created once
+    build_lock = threading.Lock()
+
+    def run_celebrity(celebrity_queries: List[Tuple[int, str, str]]) -> List[Tuple[int, str, str, Dict]]:
+        if not hasattr(local, 'graph'):
+            with build_lock:
+                local.graph = CelebrityQuestionGraph()
+
+        outcomes = []
+        for line_num, celebrity, question in celebrity_queries:
+            try:
+                outcomes.append((line_num, celebrity, question, local.graph.run(celebrity, question)))
+            except Exception as e:
+                outcomes.append((line_num, celebrity, question, {'error': str(e), 'matches_count': None}))
+        return outcomes
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(by_celebrity)))) as executor:
+        futures = [executor.submit(run_celebrity, group) for group in by_celebrity.values()]
+
+        for future in as_completed(futures):
+            for line_num, celebrity, question, result in future.result():
+                print(f"\n[Query {line_num}] {celebrity}: {question}")
+                if result['matches_count'] is None:
+                    print(f"Error on line {line_num}: {result['error']}")
+                else:
+                    print(f"Result: {result['matches_count']} matches")
+
+
 def interactive_mode():
     """Run in interactive mode"""
     print_banner()
@@ -233,29 +318,8 @@ Examples:
             print(f"Error: File not found: {args.batch}")
             sys.exit(1)
 
-        graph = CelebrityQuestionGraph()
-
-        with open(args.batch, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                try:
-                    # Expected format: celebrity|question
-                    celebrity, question = line.split('|', 1)
-                    celebrity = celebrity.strip()
-                    question = question.strip()
-
-                    print(f"\n[Query {line_num}] {celebrity}: {question}")
-                    result = graph.run(celebrity, question)
-                    print(f"Result: {result['matches_count']} matches")
-
-                except ValueError:
-                    print(f"Error on line {line_num}: Invalid format (expected: celebrity|question)")
-                except Exception as e:
-                    print(f"Error on line {line_num}: {e}")
-
+        queries = parse_batch_file(args.batch)
+        run_batch(queries)
         return
 
     # Single query mode
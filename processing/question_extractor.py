@@ -14,13 +14,68 @@ Extracts ONLY interviewer questions from transcripts
 """
 
 import re
-from typing import List, Dict, Optional
+from array import array
+from collections import deque
+from itertools import islice
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Iterator, NamedTuple
 import os
 from utils.logger import get_logger
 from utils.llm_cost_tracker import get_claude_client, get_cost_tracker
 
 logger = get_logger(__name__)
 
+# One sentence: a lone terminator, or text up to a '.', '!' or '?' that is followed by
+# whitespace (or the end of the text). Same spans as splitting on r'(?<=[.!?])\s+',
+# without materializing the pieces first; matches may carry trailing whitespace
+SENTENCE_PATTERN = re.compile(r'[.!?](?!\S)|\S(?:[^.!?]+|[.!?](?!\s))*[.!?]?')
+
+# Texts longer than this with no '.', '!' or '?' are rejected without tokenizing
+MAX_UNPUNCTUATED_CHARS = 4096
+
+# Sentences longer than this are skipped before tokenizing (well past the 200-word cap)
+MAX_SENTENCE_CHARS = 2048
+
+# Stage 1 results are cached for texts up to this length (transcript segments,
+# not whole articles/transcripts, which rarely repeat and would pin a lot of memory)
+MAX_CACHED_TEXT_CHARS = 2048
+
+# Refinement batches sent to the LLM server at the same time
+LLM_REFINE_WORKERS = 4
+
+# ULTRA-SIMPLE PROMPT - Qwen 3B struggles with filtering, so just rewrite
+REFINE_PROMPT_TEMPLATE = """Rewrite these questions to be clean interview questions.
+
+INPUT QUESTIONS:
+{numbered_questions}
+
+OUTPUT: Return each question as a numbered list. Make them clear and complete.
+Example output:
+1. What inspired you to become an actor?
+2. How do you prepare for difficult roles?
+
+Your rewritten questions:"""
+
+# Leading list numbering in LLM output ("1.", "1)", "1 -", ...)
+NUMBERING_PATTERN = re.compile(r'^(\d+)[\.):\-\s]+')
+
+# Anything but letters/digits, for comparing question texts loosely
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase a question and collapse punctuation/whitespace (for matching rewrites)"""
+    return NON_ALNUM_PATTERN.sub(' ', text.lower()).strip()
+
+
+class CandidateQuestion(NamedTuple):
+    """Stage 1 candidate from a transcript segment (lighter than a dict until the final output)"""
+    text: str
+    timestamp: float
+    speaker: str
+
 
 class QuestionExtractor:
     """
@@ -30,11 +85,17 @@ class QuestionExtractor:
     """
 
     # Interrogative words that typically start questions
-    INTERROGATIVE_WORDS = [
+    INTERROGATIVE_WORDS = frozenset({
         'what', 'why', 'how', 'when', 'where', 'who', 'which',
         'can', 'could', 'would', 'should', 'do', 'does', 'did',
         'is', 'are', 'was', 'were', 'will', 'have', 'has', 'had'
-    ]
+    })
+
+    # Sentence starts with one of INTERROGATIVE_WORDS as a whole whitespace-delimited token
+    # (ASCII-only case folding, so it agrees with first_token.lower() in INTERROGATIVE_WORDS)
+    INTERROGATIVE_START_PATTERN = re.compile(
+        r'(?ai:' + '|'.join(sorted(INTERROGATIVE_WORDS)) + r')(?!\S)'
+    )
 
     def __init__(self, use_llm: bool = True):
         """
@@ -45,13 +106,21 @@ class QuestionExtractor:
         """
         self.use_llm = use_llm
         self.cost_tracker = get_cost_tracker()
+        # LLM client is created on the first Stage 2 call (see claude_client)
+        self._claude_client = None
 
         if use_llm:
-            self.claude_client = get_claude_client()
             logger.info("✅ Question extractor initialized (TWO-STAGE: heuristics + Qwen refinement)")
         else:
             logger.info("✅ Question extractor initialized (heuristics-only mode)")
 
+    @property
+    def claude_client(self):
+        """LLM client, created on first use so heuristic-only work never builds it"""
+        if self._claude_client is None:
+            self._claude_client = get_claude_client()
+        return self._claude_client
+
     # =========================================================================
     # STAGE 1: RULE-BASED HEURISTIC EXTRACTION (NO LLM)
     # =========================================================================
@@ -62,7 +131,7 @@ class QuestionExtractor:
 
         Rules:
         1. Sentence ends with '?'
-        2. Sentence starts with OR contains interrogative word
+        2. Sentence starts with interrogative word
         3. Reasonable length (5-200 words)
 
         Args:
@@ -71,52 +140,67 @@ class QuestionExtractor:
         Returns:
             List of CANDIDATE question strings (may contain noise)
         """
-        # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        if len(text) <= MAX_CACHED_TEXT_CHARS:
+            potential_questions = list(self._heuristic_candidates(text))
+        else:
+            potential_questions = list(self._heuristic_candidates.__wrapped__(text))
 
-        potential_questions = []
+        logger.info(f"📋 STAGE 1 (Heuristics): Extracted {len(potential_questions)} candidate questions")
+        return potential_questions
 
-        for sentence in sentences:
-            sentence = sentence.strip()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _heuristic_candidates(text: str) -> Tuple[str, ...]:
+        """
+        Stage 1 rules for one text, cached by text
+        Whisper repeats segment texts (filler lines, overlapping chunk windows),
+        so repeats skip the split/tokenize work; a tuple keeps the cached value immutable
+        """
+        # Guard: one huge run-on "sentence" can't be a question, don't tokenize it
+        if len(text) > MAX_UNPUNCTUATED_CHARS and not ('?' in text or '.' in text or '!' in text):
+            logger.debug(f"Skipping {len(text)}-char text with no sentence boundaries")
+            return ()
+
+        potential_questions = []
 
-            if not sentence:
+        # Split into sentences and filter in one pass
+        for match in SENTENCE_PATTERN.finditer(text):
+            if match.end() - match.start() > MAX_SENTENCE_CHARS:
                 continue
 
+            sentence = match.group().rstrip()
+
             # Check if ends with question mark
             has_question_mark = sentence.endswith('?')
 
-            # Check if starts with interrogative word
-            words = sentence.lower().split()
-            first_word = words[0] if words else ""
-            starts_with_interrogative = first_word in self.INTERROGATIVE_WORDS
-
-            # Also check if contains an interrogative word
-            contains_interrogative = any(word in self.INTERROGATIVE_WORDS for word in words)
-
-            # Check length
-            word_count = len(words)
-            reasonable_length = 5 <= word_count <= 200
-
             # Accept if:
             # - Has question mark, OR
-            # - Starts with interrogative word, OR
-            # - Contains interrogative word AND has question mark
+            # - Starts with interrogative word (regex at the sentence start, no lowercased copy)
+            # (a question mark alone already covers "contains interrogative AND has question mark")
             is_question = (
                 has_question_mark or
-                starts_with_interrogative or
-                (contains_interrogative and has_question_mark)
+                QuestionExtractor.INTERROGATIVE_START_PATTERN.match(text, match.start()) is not None
             )
+            if not is_question:
+                continue
 
-            if reasonable_length and is_question:
-                # Clean up the question
-                question = sentence.strip()
-                if not question.endswith('?'):
-                    question += '?'
+            # Check length (only tokenized for sentences that look like questions)
+            # Single-space-separated text (the usual Whisper output): words = spaces + 1,
+            # without building a word list; anything else (tabs, newlines, runs of spaces) splits
+            if sentence.isprintable() and '  ' not in sentence:
+                word_count = sentence.count(' ') + 1
+            else:
+                word_count = len(sentence.split())
+            reasonable_length = 5 <= word_count <= 200
+
+            if reasonable_length:
+                # Clean up the question (sentence is already trimmed: starts at a
+                # non-space character, trailing whitespace removed above)
+                question = sentence if has_question_mark else sentence + '?'
 
                 potential_questions.append(question)
 
-        logger.info(f"📋 STAGE 1 (Heuristics): Extracted {len(potential_questions)} candidate questions")
-        return potential_questions
+        return tuple(potential_questions)
 
     # =========================================================================
     # STAGE 2: LLM-BASED REFINEMENT (CLAUDE ONLY, QUESTIONS ONLY)
@@ -156,78 +240,242 @@ class QuestionExtractor:
 
         logger.info(f"🤖 STAGE 2 (LLM): Refining {len(candidate_questions)} candidates with Qwen")
 
-        refined_questions = []
+        refined_questions = list(self.iter_refined_questions(candidate_questions, batch_size))
+
+        logger.info(f"✅ STAGE 2 (LLM): Final refined questions: {len(refined_questions)}")
+        return refined_questions
+
+    def iter_refined_questions(
+        self,
+        candidate_questions: List[str],
+        batch_size: int = 30
+    ) -> Iterator[str]:
+        """
+        STAGE 2 as a generator: yields refined questions batch by batch
+        Callers can start downstream work on the first batches, or stop early
+        (e.g. itertools.islice for the first K) and skip the remaining LLM calls
+
+        Args:
+            candidate_questions: List of candidate questions from Stage 1
+            batch_size: Number of questions to process per LLM call
+
+        Yields:
+            Refined, clean interview questions (raw candidates for a failed batch)
+        """
+        if not self.use_llm:
+            yield from candidate_questions
+            return
 
         # Process in batches
-        for i in range(0, len(candidate_questions), batch_size):
-            batch = candidate_questions[i:i + batch_size]
+        for _, batch, refined in self._iter_refine_batches(candidate_questions, batch_size):
+            if refined is None:
+                # Fallback: include all from this batch (better than losing data)
+                yield from batch
+            else:
+                for _, question in refined:
+                    yield question
+
+    def refine_question_groups(
+        self,
+        candidate_groups: List[List[str]],
+        batch_size: int = 30
+    ) -> List[List[str]]:
+        """
+        STAGE 2 for several sources at once (e.g. one group per article)
 
-            logger.info(f"  Processing batch {i//batch_size + 1} ({len(batch)} questions)")
+        Candidates from all groups share LLM batches, so N small sources cost
+        about one call instead of N. Refined questions are mapped back to their
+        group using the numbering of the LLM output.
 
-            # Create numbered list for Qwen
-            numbered_questions = "\n".join(
-                [f"{idx+1}. {q}" for idx, q in enumerate(batch)]
-            )
+        Args:
+            candidate_groups: One list of candidate questions per source
+            batch_size: Number of questions to process per LLM call
 
-            # ULTRA-SIMPLE PROMPT - Qwen 3B struggles with filtering, so just rewrite
-            prompt = f"""Rewrite these questions to be clean interview questions.
+        Returns:
+            One list of refined questions per input group (same order)
+        """
+        if not self.use_llm:
+            return [list(group) for group in candidate_groups]
 
-INPUT QUESTIONS:
-{numbered_questions}
+        # Flatten to (group_index, question) so batches can span groups
+        flat = [
+            (group_idx, question)
+            for group_idx, group in enumerate(candidate_groups)
+            for question in group
+        ]
+        refined_groups = [[] for _ in candidate_groups]
 
-OUTPUT: Return each question as a numbered list. Make them clear and complete.
-Example output:
-1. What inspired you to become an actor?
-2. How do you prepare for difficult roles?
+        if not flat:
+            return refined_groups
 
-Your rewritten questions:"""
+        logger.info(
+            f"🤖 STAGE 2 (LLM): Refining {len(flat)} candidates "
+            f"from {len(candidate_groups)} sources with Qwen"
+        )
 
-            try:
-                response = self.claude_client.generate(
-                    prompt=prompt,
-                    system="You rewrite questions to be clear and complete.",
-                    max_tokens=2000,
-                    temperature=0.2,  # Slightly creative for rewriting
-                    purpose="question_refinement"
-                )
-
-                # DEBUG: Log what Qwen actually returned
-                logger.info(f"  Qwen response ({len(response)} chars): {repr(response[:150])}")
-
-                # Parse response
-                if "NONE" in response.upper() and len(response.strip()) < 20:
-                    logger.info(f"  Batch {i//batch_size + 1}: No valid questions found")
-                    continue
-
-                # Extract questions from numbered list
-                lines = response.strip().split('\n')
-                batch_count = 0
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line:
+        for idx, question in self._refine_indexed([question for _, question in flat], batch_size):
+            refined_groups[flat[idx][0]].append(question)
+
+        return refined_groups
+
+    def _refine_indexed(
+        self,
+        candidate_questions: List[str],
+        batch_size: int = 30
+    ) -> List[Tuple[int, str]]:
+        """
+        STAGE 2 keeping track of which candidate each refined question came from
+
+        Refined lines are mapped back by the numbering of the LLM output; an
+        unnumbered line falls back to a normalized-text lookup of the batch
+        (only matches when the LLM left the question unchanged)
+
+        Args:
+            candidate_questions: Candidate questions from Stage 1
+            batch_size: Number of questions to process per LLM call
+
+        Returns:
+            (candidate index, refined question) pairs, in output order
+        """
+        indexed = []
+
+        for i, batch, refined in self._iter_refine_batches(candidate_questions, batch_size):
+            if refined is None:
+                # Fallback: include all from this batch (better than losing data)
+                indexed.extend((i + position, question) for position, question in enumerate(batch))
+                continue
+
+            position_by_text = None
+            for position, question in refined:
+                if position is None or not 0 <= position < len(batch):
+                    if position_by_text is None:
+                        position_by_text = {
+                            normalize_question(candidate): pos for pos, candidate in enumerate(batch)
+                        }
+                    position = position_by_text.get(normalize_question(question))
+                    if position is None:
+                        logger.debug(f"  Dropping unnumbered refined question: {question[:50]}")
                         continue
+                indexed.append((i + position, question))
 
-                    # Remove numbering (handles formats like "1.", "1)", "1 -", etc.)
-                    clean_line = re.sub(r'^\d+[\.):\-\s]+', '', line).strip()
+        return indexed
 
-                    if clean_line and len(clean_line) >= 10:
-                        # Ensure it ends with question mark
-                        if not clean_line.endswith('?'):
-                            clean_line += '?'
-                        refined_questions.append(clean_line)
-                        batch_count += 1
+    def _iter_refine_batches(
+        self,
+        candidate_questions: List[str],
+        batch_size: int
+    ) -> Iterator[Tuple[int, List[str], Optional[List[Tuple[Optional[int], str]]]]]:
+        """
+        Run _refine_batch over every batch, up to LLM_REFINE_WORKERS calls at a time
+        The batches are independent (same prompt, different questions), so their
+        LLM round-trips overlap instead of running back to back. Batches are
+        submitted as earlier ones are consumed, so a caller that stops iterating
+        early skips the LLM calls for the remaining batches
+
+        Args:
+            candidate_questions: Candidate questions from Stage 1
+            batch_size: Number of questions to process per LLM call
 
-                logger.info(f"  Batch {i//batch_size + 1}: Extracted {batch_count} refined questions")
+        Yields:
+            (start index, batch, refined) per batch, in batch order; refined is
+            None if the LLM call failed (caller keeps the raw candidates)
+        """
+        starts = iter(range(0, len(candidate_questions), batch_size))
+        num_batches = -(-len(candidate_questions) // batch_size)
 
+        def refine(start: int) -> Optional[List[Tuple[Optional[int], str]]]:
+            batch = candidate_questions[start:start + batch_size]
+            try:
+                return self._refine_batch(batch, start // batch_size + 1)
             except Exception as e:
                 logger.error(f"❌ Error in LLM refinement: {e}")
-                # Fallback: include all from this batch (better than losing data)
                 logger.warning(f"  Fallback: Keeping all {len(batch)} candidates from this batch")
-                refined_questions.extend(batch)
+                return None
+
+        if num_batches <= 1:
+            for start in starts:
+                yield start, candidate_questions[start:start + batch_size], refine(start)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(LLM_REFINE_WORKERS, num_batches))
+        try:
+            in_flight = deque(
+                (start, executor.submit(refine, start))
+                for start in islice(starts, LLM_REFINE_WORKERS)
+            )
+            while in_flight:
+                start, future = in_flight.popleft()
+                for next_start in islice(starts, 1):
+                    in_flight.append((next_start, executor.submit(refine, next_start)))
+                yield start, candidate_questions[start:start + batch_size], future.result()
+        finally:
+            # Early exit: drop batches that haven't started
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refine_batch(
+        self,
+        batch: List[str],
+        batch_num: int
+    ) -> List[Tuple[Optional[int], str]]:
+        """
+        Send one batch of candidate questions to Qwen and parse the numbered reply
 
-        logger.info(f"✅ STAGE 2 (LLM): Final refined questions: {len(refined_questions)}")
-        return refined_questions
+        Args:
+            batch: Candidate question strings
+            batch_num: 1-based batch number (for logging)
+
+        Returns:
+            List of (position, question) pairs; position is the 0-based index of the
+            input the output line was numbered as, or None if the line had no number
+
+        Raises:
+            Exception: If the LLM call fails (caller decides the fallback)
+        """
+        logger.info(f"  Processing batch {batch_num} ({len(batch)} questions)")
+
+        # Create numbered list for Qwen
+        numbered_questions = "\n".join(f"{idx}. {q}" for idx, q in enumerate(batch, 1))
+
+        prompt = REFINE_PROMPT_TEMPLATE.format(numbered_questions=numbered_questions)
+
+        response = self.claude_client.generate(
+            prompt=prompt,
+            system="You rewrite questions to be clear and complete.",
+            max_tokens=2000,
+            temperature=0.2,  # Slightly creative for rewriting
+            purpose="question_refinement"
+        )
+
+        # DEBUG: Log what Qwen actually returned
+        logger.info(f"  Qwen response ({len(response)} chars): {repr(response[:150])}")
+
+        # Parse response
+        if "NONE" in response.upper() and len(response.strip()) < 20:
+            logger.info(f"  Batch {batch_num}: No valid questions found")
+            return []
+
+        # Extract questions from numbered list
+        lines = response.strip().split('\n')
+        refined = []
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Remove numbering (handles formats like "1.", "1)", "1 -", etc.)
+            number_match = NUMBERING_PATTERN.match(line)
+            clean_line = line[number_match.end():].strip() if number_match else line
+
+            if clean_line and len(clean_line) >= 10:
+                # Ensure it ends with question mark
+                if not clean_line.endswith('?'):
+                    clean_line += '?'
+                position = int(number_match.group(1)) - 1 if number_match else None
+                refined.append((position, clean_line))
+
+        logger.info(f"  Batch {batch_num}: Extracted {len(refined)} refined questions")
+        return refined
 
     # =========================================================================
     # EXTRACTION FROM DIFFERENT SOURCES
@@ -249,45 +497,84 @@ Your rewritten questions:"""
         Returns:
             List of question dicts with text and timestamp
         """
-        # STAGE 1: Heuristic extraction from segments
-        questions_with_timestamps = []
-
-        for segment in segments:
-            text = segment.get("text", "")
-            speaker = segment.get("speaker", "unknown")
-
-            # If speaker-aware, only process interviewer segments
-            if speaker_aware and speaker != "interviewer" and speaker != "unknown":
-                continue
-
-            # Extract candidate questions
-            candidate_questions = self.extract_questions_heuristic(text)
-
-            for question in candidate_questions:
-                questions_with_timestamps.append({
-                    "text": question,
-                    "timestamp": segment.get("start", 0),
-                    "speaker": speaker
-                })
-
-        if not questions_with_timestamps:
+        # STAGE 1: Heuristic extraction from segments, kept as parallel columns
+        # (Stage 2 only needs the texts; rows are built once, for the final output)
+        texts: List[str] = []
+        timestamps = array('d')
+        speakers: List[str] = []
+        for candidate in self._iter_heuristic_questions(segments, speaker_aware):
+            texts.append(candidate.text)
+            timestamps.append(candidate.timestamp)
+            speakers.append(candidate.speaker)
+
+        if not texts:
             return []
 
         # STAGE 2: LLM refinement (only on question texts, not full segments)
         if self.use_llm:
-            question_texts = [q["text"] for q in questions_with_timestamps]
-            refined_texts = self.refine_questions_with_llm(question_texts)
+            # Repeated candidates (overlapping segments, repeated lines) are refined once
+            unique_texts = []
+            occurrences: List[List[int]] = []
+            unique_index: Dict[str, int] = {}
+            for idx, text in enumerate(texts):
+                key = normalize_question(text)
+                unique_idx = unique_index.get(key)
+                if unique_idx is None:
+                    unique_idx = unique_index[key] = len(unique_texts)
+                    unique_texts.append(text)
+                    occurrences.append([])
+                occurrences[unique_idx].append(idx)
+
+            logger.info(
+                f"🤖 STAGE 2 (LLM): Refining {len(unique_texts)} unique candidates "
+                f"({len(texts)} total) with Qwen"
+            )
 
-            # Filter to only keep refined questions
-            refined_set = set(refined_texts)
+            # Refined (possibly rewritten) text goes back to every occurrence's timestamp
+            refined = sorted(
+                (idx, question)
+                for unique_idx, question in self._refine_indexed(unique_texts)
+                for idx in occurrences[unique_idx]
+            )
+            questions_with_timestamps = [
+                {"text": question, "timestamp": timestamps[idx], "speaker": speakers[idx]}
+                for idx, question in refined
+            ]
+        else:
             questions_with_timestamps = [
-                q for q in questions_with_timestamps
-                if q["text"] in refined_set
+                {"text": text, "timestamp": timestamp, "speaker": speaker}
+                for text, timestamp, speaker in zip(texts, timestamps, speakers)
             ]
 
         logger.info(f"✅ TWO-STAGE: Extracted {len(questions_with_timestamps)} final questions from segments")
         return questions_with_timestamps
 
+    def _iter_heuristic_questions(
+        self,
+        segments: List[Dict],
+        speaker_aware: bool
+    ) -> Iterator[CandidateQuestion]:
+        """
+        STAGE 1 over segments, yielding one candidate at a time
+
+        Args:
+            segments: List of segment dicts with 'text', 'start', 'speaker' (optional)
+            speaker_aware: If True, only extract from 'interviewer' segments
+
+        Yields:
+            CandidateQuestion per heuristic match, in segment order
+        """
+        for segment in segments:
+            speaker = segment.get("speaker", "unknown")
+
+            # If speaker-aware, only process interviewer segments
+            if speaker_aware and speaker != "interviewer" and speaker != "unknown":
+                continue
+
+            timestamp = segment.get("start", 0)
+            for question in self.extract_questions_heuristic(segment.get("text", "")):
+                yield CandidateQuestion(question, timestamp, speaker)
+
     def extract_from_transcript(
         self,
         transcript_data: Dict,
@@ -359,9 +646,34 @@ Your rewritten questions:"""
         logger.info(f"✅ TWO-STAGE: Extracted {len(refined_questions)} final questions from article")
         return refined_questions
 
+    def extract_from_articles_batch(self, article_texts: List[str]) -> List[List[str]]:
+        """
+        Extract questions from several articles at once
+        Uses TWO-STAGE pipeline, with one shared Stage 2 (see refine_question_groups)
+        so N articles cost about ceil(total candidates / batch_size) LLM calls, not N
+
+        Args:
+            article_texts: Full text of each article
+
+        Returns:
+            One list of refined question strings per article (same order)
+        """
+        # STAGE 1: Heuristic extraction per article
+        candidate_groups = [self.extract_questions_heuristic(text) for text in article_texts]
+
+        # STAGE 2: LLM refinement across all articles
+        refined_groups = self.refine_question_groups(candidate_groups)
+
+        logger.info(
+            f"✅ TWO-STAGE: Extracted {sum(len(group) for group in refined_groups)} final questions "
+            f"from {len(article_texts)} articles"
+        )
+        return refined_groups
+
 
-# Global instance
-_extractor = None
+# Global instances, one per use_llm setting
+_extractors: Dict[bool, QuestionExtractor] = {}
+_extractors_lock = threading.Lock()
 
 def get_question_extractor(use_llm: bool = True) -> QuestionExtractor:
     """
@@ -372,10 +684,14 @@ def get_question_extractor(use_llm: bool = True) -> QuestionExtractor:
     Args:
         use_llm: If True, uses TWO-STAGE pipeline with Qwen refinement
     """
-    global _extractor
-    if _extractor is None:
-        _extractor = QuestionExtractor(use_llm=use_llm)
-    return _extractor
+    extractor = _extractors.get(use_llm)
+    if extractor is None:
+        with _extractors_lock:
+            extractor = _extractors.get(use_llm)
+            if extractor is None:
+                extractor = QuestionExtractor(use_llm=use_llm)
+                _extractors[use_llm] = extractor
+    return extractor
 
 
 if __name__ == "__main__":
@@ -5,14 +5,75 @@ Reduces redundancy and improves organization
 """
 
 import numpy as np
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Dict, Optional, Tuple, Union
 import logging
+import threading
 from sklearn.cluster import AgglomerativeClustering
 from embeddings.embedder import get_embedder
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Normalized embeddings kept per question text (shared by all chunker methods),
+# stored as float16 and upcast to float32 for the similarity GEMMs
+EMBEDDING_CACHE_SIZE = 10000
+
+# Above this many pairwise similarities (64 MB as float32), compute them in row tiles
+SIMILARITY_TILE_MIN_PAIRS = 16 * 1024 * 1024
+
+# Rows per similarity tile (tile is SIMILARITY_TILE_ROWS x n)
+SIMILARITY_TILE_ROWS = 256
+
+
+@dataclass(frozen=True)
+class DedupResult:
+    """
+    One deduplicated group, referencing the original question dicts
+    Sources are only merged if a caller reads all_sources or as_dict()
+    """
+    representative: Dict
+    group_indices: Tuple[int, ...]
+    questions: List[Dict] = field(repr=False)
+
+    @property
+    def text(self) -> str:
+        return self.representative["text"]
+
+    @property
+    def duplicate_count(self) -> int:
+        return len(self.group_indices)
+
+    @cached_property
+    def all_sources(self) -> List[Dict]:
+        """Source info of every question in the group"""
+        return [
+            {
+                "source_url": self.questions[idx].get("source_url"),
+                "source_title": self.questions[idx].get("source_title"),
+                "timestamp": self.questions[idx].get("timestamp"),
+                "date": self.questions[idx].get("date")
+            }
+            for idx in self.group_indices
+        ]
+
+    def as_dict(self, keep_all_sources: bool = True) -> Dict:
+        """
+        Materialize the group as a question dict (the deduplicate_questions format)
+
+        Args:
+            keep_all_sources: If True, attach merged sources for duplicate groups
+        """
+        representative = self.representative.copy()
+
+        if keep_all_sources and len(self.group_indices) > 1:
+            representative["all_sources"] = self.all_sources
+            representative["duplicate_count"] = len(self.group_indices)
+
+        return representative
+
 
 class SemanticChunker:
     """
@@ -30,13 +91,17 @@ class SemanticChunker:
         """
         self.similarity_threshold = similarity_threshold
         self.embedder = get_embedder()
+        # text -> L2-normalized float32 embedding (LRU, see _get_embeddings)
+        self._embedding_cache = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
         logger.info(f"Semantic chunker initialized (threshold: {similarity_threshold})")
 
     def deduplicate_questions(
         self,
         questions: List[Dict],
-        keep_all_sources: bool = True
-    ) -> List[Dict]:
+        keep_all_sources: bool = True,
+        return_dataclass: bool = False
+    ) -> Union[List[Dict], List[DedupResult]]:
         """
         Remove duplicate or highly similar questions
         Keeps unique questions and merges sources
@@ -44,6 +109,8 @@ class SemanticChunker:
         Args:
             questions: List of question dicts with 'text', 'timestamp', source info
             keep_all_sources: If True, merge sources for duplicate questions
+            return_dataclass: If True, return lazy DedupResult views instead of
+                              copied dicts (sources merged only on access)
 
         Returns:
             List of deduplicated questions with merged sources
@@ -52,6 +119,8 @@ class SemanticChunker:
             return []
 
         if len(questions) == 1:
+            if return_dataclass:
+                return [DedupResult(questions[0], (0,), questions)]
             return questions
 
         logger.info(f"Deduplicating {len(questions)} questions")
@@ -59,56 +128,124 @@ class SemanticChunker:
         # Extract question texts
         texts = [q["text"] for q in questions]
 
-        # Get embeddings
-        embeddings = self.embedder.embed_batch(texts)
+        # Find groups of similar questions
+        groups = self._group_texts(texts, self.similarity_threshold)
 
-        # Compute pairwise similarity matrix
-        similarity_matrix = np.dot(embeddings, embeddings.T)
+        # Create deduplicated list (first question of each group is the representative)
+        results = [DedupResult(questions[group[0]], tuple(group), questions) for group in groups]
 
-        # Find groups of similar questions
-        groups = []
-        used = set()
+        if return_dataclass:
+            deduplicated = results
+        else:
+            deduplicated = [result.as_dict(keep_all_sources) for result in results]
 
-        for i in range(len(questions)):
-            if i in used:
-                continue
+        logger.info(f"Deduplicated to {len(deduplicated)} unique questions")
+        return deduplicated
 
-            # Find all questions similar to this one
-            group = [i]
-            for j in range(i + 1, len(questions)):
-                if j not in used and similarity_matrix[i, j] >= self.similarity_threshold:
-                    group.append(j)
-                    used.add(j)
+    def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        L2-normalized embeddings for texts, embedding only those not seen recently
+        The chunker methods are often run back to back on the same questions,
+        so each text goes through the model once
 
-            groups.append(group)
-            used.add(i)
+        Args:
+            texts: Question texts
 
-        # Create deduplicated list
-        deduplicated = []
+        Returns:
+            float32 array of shape (len(texts), embedding_dim)
+        """
+        with self._embedding_cache_lock:
+            cached = [self._embedding_cache.get(text) for text in texts]
+            for text, embedding in zip(texts, cached):
+                if embedding is not None:
+                    self._embedding_cache.move_to_end(text)
+
+        # Embed each missing text once (in one model call)
+        missing = list(dict.fromkeys(text for text, embedding in zip(texts, cached) if embedding is None))
+        if missing:
+            new_embeddings = np.asarray(self.embedder.embed_batch(missing), dtype=np.float32)
+            norms = np.linalg.norm(new_embeddings, axis=1, keepdims=True)
+            new_embeddings /= np.maximum(norms, 1e-12)
+            embedded = dict(zip(missing, new_embeddings.astype(np.float16)))
+
+            with self._embedding_cache_lock:
+                self._embedding_cache.update(embedded)
+                while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+
+            cached = [embedded[text] if embedding is None else embedding for text, embedding in zip(texts, cached)]
+
+        return np.stack(cached).astype(np.float32)
+
+    def _group_texts(self, texts: List[str], threshold: float) -> List[List[int]]:
+        """
+        _similar_groups over texts, with an exact-duplicate pre-pass
+        Identical texts have identical embeddings, so they always land in the
+        group of their first occurrence; only the unique texts are grouped
+        semantically (and nothing is embedded if there is just one)
 
-        for group in groups:
-            # Take the first question as representative
-            representative = questions[group[0]].copy()
+        Args:
+            texts: Question texts
+            threshold: Similarity threshold for joining a group
 
-            if keep_all_sources and len(group) > 1:
-                # Merge sources from all similar questions
-                all_sources = []
-                for idx in group:
-                    source_info = {
-                        "source_url": questions[idx].get("source_url"),
-                        "source_title": questions[idx].get("source_title"),
-                        "timestamp": questions[idx].get("timestamp"),
-                        "date": questions[idx].get("date")
-                    }
-                    all_sources.append(source_info)
+        Returns:
+            Groups of indices into texts; each group starts with its representative
+        """
+        unique_index = {}
+        occurrences: List[List[int]] = []
 
-                representative["all_sources"] = all_sources
-                representative["duplicate_count"] = len(group)
+        for idx, text in enumerate(texts):
+            u = unique_index.setdefault(text, len(occurrences))
+            if u == len(occurrences):
+                occurrences.append([idx])
+            else:
+                occurrences[u].append(idx)
 
-            deduplicated.append(representative)
+        if len(occurrences) == 1:
+            return [occurrences[0]]
 
-        logger.info(f"Deduplicated to {len(deduplicated)} unique questions")
-        return deduplicated
+        unique_groups = self._similar_groups(self._get_embeddings(list(unique_index)), threshold)
+
+        # First occurrences are in group order, so sorting keeps the representative first
+        return [sorted(idx for u in group for idx in occurrences[u]) for group in unique_groups]
+
+    @staticmethod
+    def _similar_groups(embeddings: np.ndarray, threshold: float) -> List[List[int]]:
+        """
+        Greedy grouping: each not-yet-grouped item, in order, takes every later
+        not-yet-grouped item whose similarity to it is >= threshold
+
+        Args:
+            embeddings: (n, dim) embedding matrix
+            threshold: Similarity threshold for joining a group
+
+        Returns:
+            Groups of indices; each group starts with its representative
+        """
+        n = len(embeddings)
+
+        # One GEMM for all pairwise similarities, or one per row tile for large n
+        # so the full n x n matrix is never materialized
+        tile_rows = n if n * n <= SIMILARITY_TILE_MIN_PAIRS else SIMILARITY_TILE_ROWS
+
+        groups = []
+        used = np.zeros(n, dtype=bool)
+
+        for i in range(n):
+            if i % tile_rows == 0:
+                similar = np.dot(embeddings[i:i + tile_rows], embeddings.T) >= threshold
+
+            if used[i]:
+                continue
+
+            # All later, still-unused questions similar to this one
+            members = np.flatnonzero(similar[i % tile_rows, i + 1:] & ~used[i + 1:]) + (i + 1)
+            used[members] = True
+            used[i] = True
+
+            groups.append([i, *members.tolist()])
+
+        return groups
 
     def cluster_questions(
         self,
@@ -133,21 +270,27 @@ class SemanticChunker:
 
         # Extract texts and get embeddings
         texts = [q["text"] for q in questions]
-        embeddings = self.embedder.embed_batch(texts)
+        embeddings = self._get_embeddings(texts)
 
         # Determine number of clusters
         if n_clusters is None:
             # Auto-determine: roughly sqrt(n) clusters
             n_clusters = max(2, int(np.sqrt(len(questions))))
 
+        # Cosine distances in one GEMM (embeddings are L2-normalized),
+        # so sklearn doesn't recompute them pairwise
+        distances = 1.0 - np.dot(embeddings, embeddings.T)
+        np.clip(distances, 0.0, 2.0, out=distances)
+        np.fill_diagonal(distances, 0.0)
+
         # Perform clustering
         clustering = AgglomerativeClustering(
             n_clusters=min(n_clusters, len(questions)),
-            metric='cosine',
+            metric='precomputed',
             linkage='average'
         )
 
-        labels = clustering.fit_predict(embeddings)
+        labels = clustering.fit_predict(distances)
 
         # Group questions by cluster
         clusters = {}
@@ -178,30 +321,12 @@ class SemanticChunker:
         if not questions:
             return {}
 
-        # Get embeddings
-        embeddings = self.embedder.embed_batch(questions)
-
-        # Compute similarity matrix
-        similarity_matrix = np.dot(embeddings, embeddings.T)
-
         # Find groups
         merged = {}
-        used = set()
-
-        for i in range(len(questions)):
-            if i in used:
-                continue
-
-            # Find similar questions
-            variants = [questions[i]]
-            for j in range(i + 1, len(questions)):
-                if j not in used and similarity_matrix[i, j] >= merge_threshold:
-                    variants.append(questions[j])
-                    used.add(j)
 
+        for group in self._group_texts(questions, merge_threshold):
             # Use first as representative
-            merged[questions[i]] = variants
-            used.add(i)
+            merged[questions[group[0]]] = [questions[idx] for idx in group]
 
         logger.info(f"Merged {len(questions)} questions into {len(merged)} groups")
         return merged
@@ -229,24 +354,23 @@ class SemanticChunker:
 
         # Get embeddings
         texts = [q["text"] for q in questions]
-        embeddings = self.embedder.embed_batch(texts)
+        embeddings = self._get_embeddings(texts)
 
         # Greedily select diverse questions
         selected = [0]  # Always keep first
-        selected_embeddings = [embeddings[0]]
+        # Selected embeddings fill this matrix row by row (no per-candidate list)
+        selected_embeddings = np.empty_like(embeddings)
+        selected_embeddings[0] = embeddings[0]
 
         for i in range(1, len(questions)):
-            # Compute similarity to all selected
-            similarities = [
-                np.dot(embeddings[i], emb)
-                for emb in selected_embeddings
-            ]
+            # Compute similarity to all selected (one matrix-vector product)
+            similarities = selected_embeddings[:len(selected)] @ embeddings[i]
 
             # Keep if sufficiently different from all selected
-            max_similarity = max(similarities)
+            max_similarity = similarities.max()
             if (1 - max_similarity) >= min_distance:
+                selected_embeddings[len(selected)] = embeddings[i]
                 selected.append(i)
-                selected_embeddings.append(embeddings[i])
 
         filtered = [questions[i] for i in selected]
 
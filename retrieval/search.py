@@ -8,6 +8,7 @@ import numpy as np
 from typing import List, Dict, Optional, Tuple
 import logging
 from embeddings.embedder import get_embedder
+from embeddings.batcher import get_micro_batcher
 from vector_db.faiss_index import FAISSIndexManager
 from vector_db.metadata_store import MetadataStore
 
@@ -36,16 +37,88 @@ class QuestionRetriever:
         """
         self.similarity_threshold = similarity_threshold
         self.embedder = get_embedder()
+        self.query_batcher = get_micro_batcher()
+        # The embedder returns unit vectors, so query re-normalization is skipped;
+        # checked once here in case the model is swapped for one that doesn't
+        probe_norm = float(np.linalg.norm(self.embedder.embed_single("probe")))
+        self._normalize_queries = abs(probe_norm - 1.0) > 1e-3
+        if self._normalize_queries:
+            logger.warning(f"Embedder returns non-unit vectors (norm {probe_norm:.3f}); normalizing queries")
         self.faiss_manager = FAISSIndexManager(index_dir)
         self.metadata_store = MetadataStore(metadata_dir)
+        # celebrity_name -> (index mtime, metadata mtime) of the copies held in memory
+        self._loaded_mtimes: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        # Most recent raw search, so explain_no_results can skip re-embedding the same query
+        self._last: Optional[Dict] = None
 
         logger.info(f"Retriever initialized (threshold: {similarity_threshold})")
 
+    def _ensure_loaded(self, celebrity_name: str) -> bool:
+        """
+        Load a celebrity's index and metadata, reusing the in-memory copies
+        until either file changes on disk (e.g. after re-ingestion)
+
+        Args:
+            celebrity_name: Name of the celebrity
+
+        Returns:
+            True if the index is available, False otherwise
+        """
+        mtimes = (
+            self.faiss_manager.get_index_mtime(celebrity_name),
+            self.metadata_store.get_metadata_mtime(celebrity_name)
+        )
+
+        if mtimes[0] is None:
+            return False
+
+        if self._loaded_mtimes.get(celebrity_name) == mtimes:
+            return True
+
+        # Search-only, so map the index file instead of reading it
+        if not self.faiss_manager.load_index(celebrity_name, mmap=True):
+            return False
+
+        self.metadata_store.load_metadata(celebrity_name)
+        self._loaded_mtimes[celebrity_name] = mtimes
+        return True
+
+    def _query_key(self, celebrity_name: str, user_question: str) -> Tuple:
+        """Cache key for a query against the currently loaded index"""
+        return (celebrity_name, user_question, self._loaded_mtimes.get(celebrity_name))
+
+    def _retrieve_raw(
+        self,
+        celebrity_name: str,
+        user_question: str,
+        k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Embed a query and search the loaded index, remembering the result
+        so explain_no_results can reuse it for the same query
+
+        Returns:
+            Tuple of (distances, indices) sorted by similarity (descending)
+        """
+        query_embedding = self.query_batcher.submit(user_question)
+        distances, indices = self.faiss_manager.search(
+            celebrity_name,
+            query_embedding,
+            k=k,
+            normalize=self._normalize_queries
+        )
+
+        self._last = {
+            'key': self._query_key(celebrity_name, user_question),
+            'result': (distances, indices)
+        }
+        return distances, indices
+
     def retrieve(
         self,
         celebrity_name: str,
         user_question: str,
-        top_k: int = 20  # Fetch more candidates, then filter by threshold
+        top_k: int = 64  # Fetch more candidates (HNSW is approximate), then filter by threshold
     ) -> List[Dict]:
         """
         Retrieve questions similar to user query
@@ -67,12 +140,12 @@ class QuestionRetriever:
         logger.info(f"Searching for: '{user_question}'")
         logger.info(f"Celebrity: {celebrity_name}")
 
-        # Step 1: Load index and metadata
-        if not self.faiss_manager.load_index(celebrity_name):
+        # Step 1: Load index and metadata (cached until the files change)
+        if not self._ensure_loaded(celebrity_name):
             logger.warning(f"No index found for {celebrity_name}")
             return []
 
-        if not self.metadata_store.load_metadata(celebrity_name):
+        if not self.metadata_store.get_question_count(celebrity_name):
             logger.warning(f"No metadata found for {celebrity_name}")
             return []
 
@@ -84,35 +157,31 @@ class QuestionRetriever:
 
         logger.info(f"Index size: {index_size} questions")
 
-        # Step 2: Embed user question
-        query_embedding = self.embedder.embed_single(user_question)
-
-        # Step 3: Search FAISS index
+        # Step 2-3: Embed user question and search FAISS index
         # Fetch top_k candidates (more than we need, to ensure we get all above threshold)
-        k = min(top_k, index_size)
-        distances, indices = self.faiss_manager.search(
+        distances, indices = self._retrieve_raw(
             celebrity_name,
-            query_embedding,
-            k=k
+            user_question,
+            k=min(top_k, index_size)
         )
 
         logger.info(f"FAISS returned {len(distances)} candidates")
 
         # Step 4: Filter by similarity threshold
-        # FAISS IndexFlatIP returns cosine similarity (higher = more similar)
-        matches = []
-
-        for similarity, faiss_id in zip(distances, indices):
-            if similarity >= self.similarity_threshold:
-                # Get metadata
-                metadata = self.metadata_store.get_metadata(celebrity_name, int(faiss_id))
-
-                if metadata:
-                    metadata['similarity_score'] = float(similarity)
-                    matches.append(metadata)
+        # Inner-product indexes (flat or HNSW) return cosine similarity (higher = more similar),
+        # already sorted descending, so the matches are a prefix of the results
+        cut = int(np.searchsorted(-distances, -self.similarity_threshold, side='right'))
+        metadata_list = self.metadata_store.get_batch_metadata(
+            celebrity_name,
+            indices[:cut].tolist()
+        )
 
-        # Step 5: Sort by similarity (descending)
-        matches.sort(key=lambda x: x['similarity_score'], reverse=True)
+        matches = []
+        for metadata, similarity in zip(metadata_list, distances[:cut].tolist()):
+            if metadata:
+                # Rows are rebuilt per lookup, so they can be annotated in place
+                metadata['similarity_score'] = similarity
+                matches.append(metadata)
 
         logger.info(f"Found {len(matches)} matches above threshold {self.similarity_threshold}")
 
@@ -163,7 +232,7 @@ class QuestionRetriever:
             Dict with diagnostic information
         """
         # Get top result even if below threshold
-        if not self.faiss_manager.load_index(celebrity_name):
+        if not self._ensure_loaded(celebrity_name):
             return {
                 'reason': 'no_index',
                 'message': f"No data indexed for {celebrity_name}"
@@ -176,13 +245,12 @@ class QuestionRetriever:
                 'message': f"Index exists but is empty for {celebrity_name}"
             }
 
-        # Get closest match (ignore threshold)
-        query_embedding = self.embedder.embed_single(user_question)
-        distances, indices = self.faiss_manager.search(
-            celebrity_name,
-            query_embedding,
-            k=1
-        )
+        # Get closest match (ignore threshold), reusing the last retrieve() search if it was this query
+        last = self._last
+        if last is not None and last['key'] == self._query_key(celebrity_name, user_question):
+            distances, indices = last['result']
+        else:
+            distances, indices = self._retrieve_raw(celebrity_name, user_question, k=1)
 
         if len(distances) > 0:
             closest_similarity = float(distances[0])
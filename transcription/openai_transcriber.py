@@ -17,9 +17,9 @@ raise RuntimeError(
 
 from openai import OpenAI
 import os
+import subprocess
 from typing import Dict, Optional
 import logging
-from pydub import AudioSegment
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -63,31 +63,24 @@ class OpenAITranscriber:
 
         logger.info(f"Compressing audio from {file_size_mb:.2f}MB to fit under {max_size_mb}MB")
 
-        # Load audio
-        audio = AudioSegment.from_file(audio_path)
-
         # Get base path without extension for compressed file
         base_path = os.path.splitext(audio_path)[0]
         compressed_path = f"{base_path}_compressed.mp3"
 
-        # Try progressively lower bitrates until file is small enough
-        bitrates = ["64k", "48k", "32k"]
-
-        for bitrate in bitrates:
-            audio.export(
-                compressed_path,
-                format="mp3",
-                bitrate=bitrate,
-                parameters=["-ar", "16000", "-ac", "1"]  # 16kHz mono
-            )
-
-            compressed_size_mb = os.path.getsize(compressed_path) / (1024 * 1024)
-            logger.info(f"Compressed with {bitrate} bitrate to {compressed_size_mb:.2f}MB")
+        # One ffmpeg pass straight to 32 kbps 16kHz mono mp3 (~14MB per hour),
+        # streaming instead of decoding the whole file into memory first
+        command = [
+            'ffmpeg', '-nostdin', '-v', 'error', '-y',
+            '-i', audio_path,
+            '-ac', '1', '-ar', '16000',
+            '-codec:a', 'libmp3lame', '-b:a', '32k',
+            compressed_path
+        ]
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
 
-            if compressed_size_mb <= max_size_mb:
-                return compressed_path
+        compressed_size_mb = os.path.getsize(compressed_path) / (1024 * 1024)
+        logger.info(f"Compressed to {compressed_size_mb:.2f}MB")
 
-        # If still too large, warn but return the most compressed version
         if compressed_size_mb > max_size_mb:
             logger.warning(f"Audio still {compressed_size_mb:.2f}MB after max compression. May fail API upload.")
 
@@ -7,9 +7,13 @@ Ensures transparency and cost control
 """
 
 import os
+import json
 import logging
+import threading
+from collections import OrderedDict, deque
 from typing import Dict, Optional
 from datetime import datetime
+import httpx
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
@@ -19,6 +23,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = os.getenv("QWEN_MODEL", "qwen2.5:3b-instruct")
 DEFAULT_BASE_URL = os.getenv("QWEN_BASE_URL", "http://localhost:11434/v1")
 
+# Most recent calls kept in memory (totals still cover every call)
+LLM_LOG_MAX = int(os.getenv("LLM_LOG_MAX", "10000"))
+
+# Optional JSONL file receiving every call entry (full audit trail outside RAM)
+LLM_LOG_FILE = os.getenv("LLM_LOG_FILE")
+
+# Deterministic (temperature 0) responses kept per exact request
+LLM_RESPONSE_CACHE_SIZE = 1024
+
+# Pooled keep-alive connections to the LLM server (shared by all threads)
+LLM_HTTP_MAX_KEEPALIVE = 32
+LLM_HTTP_MAX_CONNECTIONS = 64
+
 # LLM pricing (local models are free, but we track for consistency)
 LLM_PRICING = {
     # Qwen models (local - $0 cost)
@@ -49,18 +66,34 @@ LLM_PRICING = {
     },
 }
 
+# (input_rate, output_rate) per model, flattened for one lookup per call
+_PRICING_RATES = {model: (p["input"], p["output"]) for model, p in LLM_PRICING.items()}
+
+# Rates for unknown models (Sonnet pricing)
+DEFAULT_PRICING_RATES = (3.00 / 1_000_000, 15.00 / 1_000_000)
+
 
 class LLMCostTracker:
     """
     Tracks LLM API costs with mandatory logging
     """
 
-    def __init__(self):
+    def __init__(self, max_log_entries: int = LLM_LOG_MAX, log_file: Optional[str] = LLM_LOG_FILE):
+        """
+        Args:
+            max_log_entries: Number of recent call entries kept in call_log
+            log_file: If set, every call entry is appended to this JSONL file
+        """
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost_usd = 0.0
         self.call_count = 0
-        self.call_log = []
+        self.call_log = deque(maxlen=max_log_entries)
+        self.log_file = log_file
+        # Unknown models already warned about (warn once, not per call)
+        self._unknown_models = set()
+        # Batch mode runs graphs on several threads against this one tracker
+        self._lock = threading.Lock()
 
     def log_call(
         self,
@@ -78,22 +111,16 @@ class LLMCostTracker:
             output_tokens: Number of output tokens
             purpose: Description of what this call was for
         """
-        # Calculate cost
-        if model in LLM_PRICING:
-            pricing = LLM_PRICING[model]
-            input_cost = input_tokens * pricing["input"]
-            output_cost = output_tokens * pricing["output"]
-            total_cost = input_cost + output_cost
-        else:
-            logger.warning(f"Unknown model: {model}, using default pricing")
-            # Default to Sonnet pricing
-            total_cost = (input_tokens * 3.00 / 1_000_000) + (output_tokens * 15.00 / 1_000_000)
+        # Calculate cost (unknown models default to Sonnet pricing)
+        rates = _PRICING_RATES.get(model)
+        if rates is None:
+            rates = DEFAULT_PRICING_RATES
+            if model not in self._unknown_models:
+                self._unknown_models.add(model)
+                logger.warning(f"Unknown model: {model}, using default pricing")
 
-        # Update totals
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_cost_usd += total_cost
-        self.call_count += 1
+        input_rate, output_rate = rates
+        total_cost = input_tokens * input_rate + output_tokens * output_rate
 
         # Log the call
         log_entry = {
@@ -104,14 +131,29 @@ class LLMCostTracker:
             "output_tokens": output_tokens,
             "cost_usd": total_cost
         }
-        self.call_log.append(log_entry)
 
-        # MANDATORY: Print cost log
-        logger.info(
-            f"LLM_CALL | model={model} | purpose={purpose} | "
-            f"input_tokens={input_tokens} | output_tokens={output_tokens} | "
-            f"cost=${total_cost:.6f}"
-        )
+        # Update totals
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cost_usd += total_cost
+            self.call_count += 1
+            self.call_log.append(log_entry)
+
+            if self.log_file:
+                try:
+                    with open(self.log_file, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(log_entry) + "\n")
+                except OSError as e:
+                    logger.error(f"Error writing LLM call log: {e}")
+
+        # MANDATORY: Print cost log (formatted only if INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"LLM_CALL | model={model} | purpose={purpose} | "
+                f"input_tokens={input_tokens} | output_tokens={output_tokens} | "
+                f"cost=${total_cost:.6f}"
+            )
 
     def print_summary(self):
         """
@@ -139,7 +181,7 @@ class LLMCostTracker:
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cost_usd": self.total_cost_usd,
-            "call_log": self.call_log
+            "call_log": list(self.call_log)
         }
 
 
@@ -161,6 +203,11 @@ def reset_cost_tracker():
     _cost_tracker = LLMCostTracker()
 
 
+# Shared by all ClaudeClient instances
+_response_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
 class ClaudeClient:
     """
     Wrapper around OpenAI-compatible API (Qwen via Ollama) with automatic cost tracking
@@ -181,10 +228,23 @@ class ClaudeClient:
         base_url = base_url or os.getenv("QWEN_BASE_URL", DEFAULT_BASE_URL)
 
         self.model = os.getenv("QWEN_MODEL", DEFAULT_MODEL)
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
-        self.cost_tracker = get_cost_tracker()
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=httpx.Client(
+                limits=httpx.Limits(
+                    max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS
+                )
+            )
+        )
         logger.info(f"✅ LLM client initialized (Qwen: {self.model}) with cost tracking")
 
+    @property
+    def cost_tracker(self) -> LLMCostTracker:
+        """Current global tracker (follows reset_cost_tracker())"""
+        return get_cost_tracker()
+
     def generate(
         self,
         prompt: str,
@@ -210,7 +270,26 @@ class ClaudeClient:
         """
         # Always use Qwen model
         actual_model = self.model
-        logger.info(f"🤖 Calling Qwen ({actual_model}): {purpose}")
+
+        # Identical deterministic requests get the same answer; serve repeats from cache
+        cache_key = (actual_model, system, prompt, max_tokens) if temperature == 0 else None
+        if cache_key is not None:
+            with _response_cache_lock:
+                cached = _response_cache.get(cache_key)
+                if cached is not None:
+                    _response_cache.move_to_end(cache_key)
+
+            if cached is not None:
+                self.cost_tracker.log_call(
+                    model=actual_model,
+                    input_tokens=0,
+                    output_tokens=0,
+                    purpose=f"{purpose}[cached]"
+                )
+                return cached
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"🤖 Calling Qwen ({actual_model}): {purpose}")
 
         messages = []
         if system:
@@ -238,17 +317,34 @@ class ClaudeClient:
             )
 
             # Extract text
-            return response.choices[0].message.content
+            text = response.choices[0].message.content
+
+            if cache_key is not None and text is not None:
+                with _response_cache_lock:
+                    _response_cache[cache_key] = text
+                    if len(_response_cache) > LLM_RESPONSE_CACHE_SIZE:
+                        _response_cache.popitem(last=False)
+
+            return text
 
         except Exception as e:
             logger.error(f"❌ Error calling Qwen: {e}")
             raise
 
 
-# Convenience function
+# Global client instance (one connection pool for the whole process)
+_claude_client = None
+_claude_client_lock = threading.Lock()
+
+
 def get_claude_client() -> ClaudeClient:
-    """Get LLM client with cost tracking (uses Qwen via Ollama)"""
-    return ClaudeClient()
+    """Get global LLM client with cost tracking (uses Qwen via Ollama)"""
+    global _claude_client
+    if _claude_client is None:
+        with _claude_client_lock:
+            if _claude_client is None:
+                _claude_client = ClaudeClient()
+    return _claude_client
 
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@ Provides file-based logging organized by date/time: Logging/{year}/{month}/{date
 All logs are also displayed on console
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +21,7 @@ class DateTimeLogger:
 
     _initialized = False
     _log_file_path = None
+    _listener = None
 
     @classmethod
     def setup_logging(cls, base_dir: str = "Logging", log_level: str = "INFO"):
@@ -65,7 +69,7 @@ class DateTimeLogger:
         root_logger.handlers.clear()
 
         # Create file handler
-        file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
+        file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8', delay=True)
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
 
@@ -74,9 +78,21 @@ class DateTimeLogger:
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
 
-        # Add handlers to root logger
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        # Callers only enqueue records; a background listener thread does the
+        # file/console I/O so hot loops never block on disk writes
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        cls._listener = logging.handlers.QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        cls._listener.start()
+
+        # Flush queued records before the interpreter exits
+        atexit.register(cls._listener.stop)
 
         cls._initialized = True
 
@@ -4,69 +4,170 @@ Handles vector storage and similarity search using FAISS
 FAISS stores ONLY vectors - metadata is handled separately
 """
 
-import faiss
 import numpy as np
 import os
+import threading
+from collections import OrderedDict
 from typing import List, Tuple, Optional
-import pickle
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Indexes with at least this many vectors switch from exact IndexFlatIP to HNSW
+HNSW_MIN_VECTORS = 2000
+
+# HNSW graph parameters (neighbors per node, build and search beam widths)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+
+# IVF-PQ compression for very large, memory-constrained indexes: the index stays
+# exact (flat) until enough vectors exist to train sqrt(N) coarse clusters and
+# the product quantizer (48 sub-vectors x 8 bits = 48 bytes per vector)
+IVFPQ_MIN_TRAIN_VECTORS = 10000
+IVFPQ_M = 48
+IVFPQ_NBITS = 8
+IVF_NPROBE = 16
+
+# Most recent search results kept per manager (exact query vector + k)
+SEARCH_CACHE_SIZE = 1024
+
+# Optional semantic cache: reuse the result of one of the last SEMANTIC_CACHE_SIZE
+# queries when a new query's cosine similarity to it is at least the threshold
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Index types accepted by create_index
+INDEX_TYPES = ("flat", "hnsw", "ivfpq")
+
+
+# faiss module, imported on first use
+_faiss_module = None
+
+
+def _faiss():
+    """
+    Import faiss on first use: loading it (BLAS, OpenMP) takes a few hundred ms,
+    which processes that never touch the vector DB shouldn't pay
+    """
+    global _faiss_module
+    if _faiss_module is None:
+        import faiss
+
+        # FAISS parallelizes searches and index builds with OpenMP; use every core
+        # unless the environment already caps threads
+        if "OMP_NUM_THREADS" not in os.environ:
+            faiss.omp_set_num_threads(os.cpu_count() or 1)
+
+        _faiss_module = faiss
+    return _faiss_module
+
 
 class FAISSIndexManager:
     """
     Manages FAISS index for semantic similarity search
     Uses IndexFlatIP (Inner Product) for cosine similarity after L2 normalization
+    Large indexes are rebuilt as IndexHNSWFlat (inner product) for sub-linear search,
+    or as compressed IndexIVFPQ when created with index_type='ivfpq'
+    With use_gpu, flat and IVF indexes are searched on the GPU
     """
 
-    def __init__(self, index_dir: str = "data/faiss_indexes"):
+    def __init__(
+        self,
+        index_dir: str = "data/faiss_indexes",
+        semantic_cache: bool = False,
+        use_gpu: bool = False
+    ):
+        """
+        Args:
+            index_dir: Directory holding the per-celebrity index files
+            semantic_cache: If True, single-query searches that are near-duplicates
+                            (cosine >= SEMANTIC_CACHE_THRESHOLD) of a recent query
+                            reuse its results instead of searching the index
+            use_gpu: If True and a FAISS GPU build sees a GPU, keep flat and IVF
+                     indexes on GPU 0 (HNSW has no GPU version and stays on CPU)
+        """
         self.index_dir = index_dir
+        self.use_gpu = use_gpu
+        self._gpu_resources = None  # faiss.StandardGpuResources, created on first use
         os.makedirs(index_dir, exist_ok=True)
         self.indexes = {}  # celebrity_name -> faiss.Index
-        self.index_sizes = {}  # celebrity_name -> current_size
+        self.index_types = {}  # celebrity_name -> index_type requested in create_index
+        # (celebrity_name, query bytes, k) -> (distances, indices), least recent first
+        self._search_cache = OrderedDict()
+        self.semantic_cache = semantic_cache
+        # celebrity_name -> {'vectors': ring buffer of recent queries, 'results': [(k, distances, indices)], 'next': slot}
+        self._semantic_cache = {}
+        # Guards both caches: searches from several request threads share them
+        self._cache_lock = threading.Lock()
 
     def _get_index_path(self, celebrity_name: str) -> str:
         """Get file path for celebrity's FAISS index"""
         safe_name = celebrity_name.lower().replace(" ", "_")
         return os.path.join(self.index_dir, f"{safe_name}.faiss")
 
-    def _get_size_path(self, celebrity_name: str) -> str:
-        """Get file path for index size metadata"""
-        safe_name = celebrity_name.lower().replace(" ", "_")
-        return os.path.join(self.index_dir, f"{safe_name}_size.pkl")
-
-    def create_index(self, celebrity_name: str, embedding_dim: int = 384):
+    def create_index(
+        self,
+        celebrity_name: str,
+        embedding_dim: int = 384,
+        index_type: str = "flat"
+    ):
         """
         Create a new FAISS index for a celebrity
 
         Args:
             celebrity_name: Name of the celebrity
             embedding_dim: Dimension of embeddings (384 for all-MiniLM-L6-v2)
+            index_type: 'flat' (exact search, rebuilt as HNSW once it reaches
+                        HNSW_MIN_VECTORS), 'hnsw' (approximate from the start,
+                        for bulk builds known to be large) or 'ivfpq' (exact until
+                        IVFPQ_MIN_TRAIN_VECTORS, then compressed to IVF-PQ)
         """
-        logger.info(f"Creating new FAISS index for {celebrity_name}")
+        faiss = _faiss()
 
-        # Use IndexFlatIP (Inner Product) for cosine similarity
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type} (expected one of {INDEX_TYPES})")
+
+        logger.info(f"Creating new FAISS index for {celebrity_name} ({index_type})")
+
+        # Both use inner product for cosine similarity
         # We'll L2-normalize vectors before adding
-        index = faiss.IndexFlatIP(embedding_dim)
+        if index_type == "hnsw":
+            index = self._new_hnsw_index(embedding_dim)
+        else:
+            index = faiss.IndexFlatIP(embedding_dim)
 
-        self.indexes[celebrity_name] = index
-        self.index_sizes[celebrity_name] = 0
+        self.indexes[celebrity_name] = self._to_device(index)
+        self.index_types[celebrity_name] = index_type
+        self._invalidate_search_cache(celebrity_name)
 
         logger.info(f"Created index with dimension {embedding_dim}")
 
-    def load_index(self, celebrity_name: str) -> bool:
+    @staticmethod
+    def _new_hnsw_index(embedding_dim: int):
+        """Empty inner-product HNSW index (needs no training)"""
+        faiss = _faiss()
+
+        index = faiss.IndexHNSWFlat(embedding_dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        return index
+
+    def load_index(self, celebrity_name: str, mmap: bool = False) -> bool:
         """
         Load existing FAISS index from disk
 
         Args:
             celebrity_name: Name of the celebrity
+            mmap: Memory-map the file read-only instead of reading it into memory
+                  (near-instant load, pages shared across processes); meant for
+                  search-only callers - don't add vectors to a mapped index
 
         Returns:
             True if loaded successfully, False otherwise
         """
+        faiss = _faiss()
+
         index_path = self._get_index_path(celebrity_name)
-        size_path = self._get_size_path(celebrity_name)
 
         if not os.path.exists(index_path):
             logger.warning(f"No index found for {celebrity_name}")
@@ -74,23 +175,29 @@ class FAISSIndexManager:
 
         try:
             logger.info(f"Loading FAISS index for {celebrity_name}")
-            index = faiss.read_index(index_path)
-            self.indexes[celebrity_name] = index
-
-            # Load size
-            if os.path.exists(size_path):
-                with open(size_path, 'rb') as f:
-                    self.index_sizes[celebrity_name] = pickle.load(f)
-            else:
-                self.index_sizes[celebrity_name] = index.ntotal
+            index = self._read_index(index_path) if mmap else faiss.read_index(index_path)
+            self.indexes[celebrity_name] = self._to_device(index)
+            self.index_types[celebrity_name] = self._infer_index_type(index)
+            self._invalidate_search_cache(celebrity_name)
 
-            logger.info(f"Loaded index with {self.index_sizes[celebrity_name]} vectors")
+            logger.info(f"Loaded index with {index.ntotal} vectors")
             return True
 
         except Exception as e:
             logger.error(f"Error loading index: {e}")
             return False
 
+    @staticmethod
+    def _read_index(index_path: str):
+        """Memory-map an index file, reading it normally if this FAISS build can't"""
+        faiss = _faiss()
+
+        try:
+            return faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except (AttributeError, RuntimeError) as e:
+            logger.warning(f"Could not memory-map {index_path} ({e}), reading it instead")
+            return faiss.read_index(index_path)
+
     def save_index(self, celebrity_name: str):
         """
         Save FAISS index to disk
@@ -98,20 +205,21 @@ class FAISSIndexManager:
         Args:
             celebrity_name: Name of the celebrity
         """
+        faiss = _faiss()
+
         if celebrity_name not in self.indexes:
             logger.error(f"No index found for {celebrity_name}")
             return
 
         index_path = self._get_index_path(celebrity_name)
-        size_path = self._get_size_path(celebrity_name)
 
         try:
             logger.info(f"Saving FAISS index for {celebrity_name}")
-            faiss.write_index(self.indexes[celebrity_name], index_path)
-
-            # Save size
-            with open(size_path, 'wb') as f:
-                pickle.dump(self.index_sizes[celebrity_name], f)
+            # Write then rename: a crash mid-write can't leave a truncated index,
+            # and readers that memory-mapped the old file keep a valid mapping
+            tmp_path = f"{index_path}.tmp"
+            faiss.write_index(self._to_cpu(self.indexes[celebrity_name]), tmp_path)
+            os.replace(tmp_path, index_path)
 
             logger.info(f"Saved index to {index_path}")
 
@@ -123,7 +231,8 @@ class FAISSIndexManager:
         self,
         celebrity_name: str,
         vectors: np.ndarray,
-        normalize: bool = True
+        normalize: bool = True,
+        inplace: bool = False
     ) -> List[int]:
         """
         Add vectors to the FAISS index
@@ -132,35 +241,150 @@ class FAISSIndexManager:
             celebrity_name: Name of the celebrity
             vectors: Numpy array of shape (n_vectors, embedding_dim)
             normalize: Whether to L2-normalize vectors (required for cosine similarity)
+            inplace: If True, a contiguous float32 `vectors` is normalized and
+                     added as-is instead of being copied first (the caller's
+                     array is modified)
 
         Returns:
             List of assigned IDs for the vectors
         """
+        faiss = _faiss()
+
         if celebrity_name not in self.indexes:
             logger.error(f"No index loaded for {celebrity_name}")
             raise ValueError(f"Index not found for {celebrity_name}")
 
-        # Normalize vectors for cosine similarity
+        # Normalize vectors for cosine similarity (normalize_L2 works in place,
+        # so unless allowed to modify the caller's array, copy it first; the copy
+        # also casts to float32)
+        if normalize and not inplace:
+            vectors = np.array(vectors, dtype=np.float32, order='C')
+        else:
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
         if normalize:
-            vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+            faiss.normalize_L2(vectors)
 
-        # Get starting ID
-        start_id = self.index_sizes.get(celebrity_name, 0)
+        # IDs are sequential: new vectors follow the ones already stored
+        index = self.indexes[celebrity_name]
+        start_id = index.ntotal
 
         # Add to index
-        self.indexes[celebrity_name].add(vectors.astype('float32'))
-
-        # Update size
-        n_vectors = len(vectors)
-        self.index_sizes[celebrity_name] = start_id + n_vectors
+        index.add(vectors)
+        self._invalidate_search_cache(celebrity_name)
 
         # Generate IDs
+        n_vectors = len(vectors)
         ids = list(range(start_id, start_id + n_vectors))
 
         logger.info(f"Added {n_vectors} vectors to {celebrity_name}'s index")
 
+        if self.index_types.get(celebrity_name) == "ivfpq":
+            self._maybe_upgrade_to_ivfpq(celebrity_name)
+        else:
+            self._maybe_upgrade_to_hnsw(celebrity_name)
+
         return ids
 
+    def _maybe_upgrade_to_hnsw(self, celebrity_name: str):
+        """
+        Rebuild a flat index as HNSW once it reaches HNSW_MIN_VECTORS
+        HNSW assigns sequential IDs, so existing FAISS IDs stay valid
+
+        Args:
+            celebrity_name: Name of the celebrity
+        """
+        faiss = _faiss()
+
+        index = self.indexes[celebrity_name]
+        if not isinstance(index, faiss.IndexFlat) or index.ntotal < HNSW_MIN_VECTORS:
+            return
+
+        logger.info(f"Rebuilding {celebrity_name}'s index as HNSW ({index.ntotal} vectors)")
+
+        hnsw_index = self._new_hnsw_index(index.d)
+        hnsw_index.add(index.reconstruct_n(0, index.ntotal))
+
+        self.indexes[celebrity_name] = hnsw_index
+
+    def _maybe_upgrade_to_ivfpq(self, celebrity_name: str):
+        """
+        Rebuild a flat index as IVF-PQ once it reaches IVFPQ_MIN_TRAIN_VECTORS
+        Trained on all stored vectors; IVF assigns sequential IDs, so existing
+        FAISS IDs stay valid
+
+        Args:
+            celebrity_name: Name of the celebrity
+        """
+        faiss = _faiss()
+
+        index = self.indexes[celebrity_name]
+        if not isinstance(index, faiss.IndexFlat) or index.ntotal < IVFPQ_MIN_TRAIN_VECTORS:
+            return
+
+        if index.d % IVFPQ_M:
+            logger.warning(f"Dimension {index.d} is not divisible by {IVFPQ_M}, keeping flat index")
+            return
+
+        nlist = int(np.sqrt(index.ntotal))
+        logger.info(f"Rebuilding {celebrity_name}'s index as IVF-PQ ({index.ntotal} vectors, {nlist} lists)")
+
+        vectors = index.reconstruct_n(0, index.ntotal)
+        quantizer = faiss.IndexFlatIP(index.d)
+        ivfpq_index = faiss.IndexIVFPQ(
+            quantizer, index.d, nlist, IVFPQ_M, IVFPQ_NBITS, faiss.METRIC_INNER_PRODUCT
+        )
+        ivfpq_index.train(vectors)
+        ivfpq_index.add(vectors)
+        # Lets reconstruct_vectors look vectors up by ID
+        ivfpq_index.make_direct_map()
+
+        self.indexes[celebrity_name] = self._to_device(ivfpq_index)
+
+    def _to_device(self, index):
+        """
+        Move an index to GPU 0 when use_gpu is set and possible
+        Returns the index unchanged otherwise (CPU-only build, no GPU, HNSW)
+        """
+        faiss = _faiss()
+
+        if not self.use_gpu or isinstance(index, faiss.IndexHNSW):
+            return index
+
+        if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+            logger.warning("use_gpu is set but no FAISS GPU is available, searching on CPU")
+            self.use_gpu = False
+            return index
+
+        if self._gpu_resources is None:
+            self._gpu_resources = faiss.StandardGpuResources()
+
+        try:
+            return faiss.index_cpu_to_gpu(self._gpu_resources, 0, index)
+        except RuntimeError as e:
+            logger.warning(f"Could not move index to GPU ({e}), keeping it on CPU")
+            return index
+
+    @staticmethod
+    def _to_cpu(index):
+        """CPU copy of a GPU index (for writing to disk); CPU indexes are returned as-is"""
+        faiss = _faiss()
+
+        if hasattr(faiss, "GpuIndex") and isinstance(index, faiss.GpuIndex):
+            return faiss.index_gpu_to_cpu(index)
+        return index
+
+    @staticmethod
+    def _infer_index_type(index) -> str:
+        """index_type matching an index read from disk"""
+        faiss = _faiss()
+
+        if isinstance(index, faiss.IndexHNSW):
+            return "hnsw"
+        if isinstance(index, faiss.IndexIVF):
+            return "ivfpq"
+        return "flat"
+
     def search(
         self,
         celebrity_name: str,
@@ -182,43 +406,187 @@ class FAISSIndexManager:
             - distances: similarity scores (higher = more similar for IP)
             - indices: FAISS IDs of matching vectors
         """
+        distances, indices = self.search_batch(
+            celebrity_name,
+            query_vector.reshape(1, -1),
+            k=k,
+            normalize=normalize
+        )
+
+        return distances[0], indices[0]
+
+    def search_batch(
+        self,
+        celebrity_name: str,
+        query_vectors: np.ndarray,
+        k: int = 5,
+        normalize: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search for several queries in one FAISS call
+
+        Args:
+            celebrity_name: Name of the celebrity
+            query_vectors: Query vectors of shape (n_queries, embedding_dim)
+            k: Number of nearest neighbors to return per query
+            normalize: Whether to L2-normalize the query vectors
+
+        Returns:
+            Tuple of (distances, indices), each of shape (n_queries, k)
+        """
+        faiss = _faiss()
+
         if celebrity_name not in self.indexes:
             logger.error(f"No index loaded for {celebrity_name}")
             raise ValueError(f"Index not found for {celebrity_name}")
 
-        # Normalize query for cosine similarity
+        # FAISS needs contiguous float32; normalize the queries (in place, on a copy)
+        # for cosine similarity
         if normalize:
-            query_vector = query_vector / np.linalg.norm(query_vector)
+            query_vectors = np.array(query_vectors, dtype=np.float32, order='C')
+            faiss.normalize_L2(query_vectors)
+        else:
+            query_vectors = np.ascontiguousarray(query_vectors, dtype=np.float32)
+
+        # Repeated queries (popular questions) are answered from the cache
+        cache_key = (celebrity_name, query_vectors.tobytes(), k)
+        with self._cache_lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.move_to_end(cache_key)
+                return cached
+
+            if self.semantic_cache and len(query_vectors) == 1:
+                cached = self._semantic_lookup(celebrity_name, query_vectors[0], k)
+                if cached is not None:
+                    return cached
+
+        # Search (HNSW beam must be at least k wide to return k results)
+        index = self.indexes[celebrity_name]
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = max(HNSW_EF_SEARCH, k)
+        elif hasattr(index, "nprobe"):  # IVF, on CPU or GPU
+            index.nprobe = IVF_NPROBE
+
+        distances, indices = index.search(query_vectors, k)
+
+        # Shared with later callers, so don't let anyone modify them
+        distances.setflags(write=False)
+        indices.setflags(write=False)
+        with self._cache_lock:
+            self._search_cache[cache_key] = (distances, indices)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+            if self.semantic_cache and len(query_vectors) == 1:
+                self._semantic_store(celebrity_name, query_vectors[0], k, distances, indices)
+
+        return distances, indices
+
+    def _semantic_lookup(
+        self,
+        celebrity_name: str,
+        query_vector: np.ndarray,
+        k: int
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Results of the most similar recent query, if it is a near-duplicate
+        and was searched with at least k neighbors (caller holds _cache_lock)
 
-        # Reshape to (1, embedding_dim) for FAISS
-        query_vector = query_vector.reshape(1, -1).astype('float32')
+        Returns:
+            Tuple of (distances, indices) of shape (1, k), or None on a miss
+        """
+        cache = self._semantic_cache.get(celebrity_name)
+        if cache is None or not cache['results']:
+            return None
 
-        # Search
-        distances, indices = self.indexes[celebrity_name].search(query_vector, k)
+        # Unit vectors: inner product is cosine similarity
+        similarities = cache['vectors'][:len(cache['results'])] @ query_vector
+        best = int(np.argmax(similarities))
+        cached_k, distances, indices = cache['results'][best]
 
-        return distances[0], indices[0]
+        if similarities[best] < SEMANTIC_CACHE_THRESHOLD or cached_k < k:
+            return None
+
+        return distances[:, :k], indices[:, :k]
+
+    def _semantic_store(
+        self,
+        celebrity_name: str,
+        query_vector: np.ndarray,
+        k: int,
+        distances: np.ndarray,
+        indices: np.ndarray
+    ):
+        """Remember a query and its results, overwriting the oldest entry when full (caller holds _cache_lock)"""
+        cache = self._semantic_cache.get(celebrity_name)
+        if cache is None:
+            cache = {
+                'vectors': np.empty((SEMANTIC_CACHE_SIZE, len(query_vector)), dtype=np.float32),
+                'results': [],
+                'next': 0
+            }
+            self._semantic_cache[celebrity_name] = cache
+
+        slot = cache['next']
+        cache['vectors'][slot] = query_vector
+        if slot < len(cache['results']):
+            cache['results'][slot] = (k, distances, indices)
+        else:
+            cache['results'].append((k, distances, indices))
+        cache['next'] = (slot + 1) % SEMANTIC_CACHE_SIZE
+
+    def _invalidate_search_cache(self, celebrity_name: str):
+        """Drop cached search results for a celebrity whose index changed"""
+        with self._cache_lock:
+            for key in [key for key in self._search_cache if key[0] == celebrity_name]:
+                del self._search_cache[key]
+            self._semantic_cache.pop(celebrity_name, None)
+
+    def reconstruct_vectors(self, celebrity_name: str, faiss_ids: List[int]) -> np.ndarray:
+        """
+        Read stored (L2-normalized) vectors back out of the index
+        (approximate for IVF-PQ indexes, which keep only compressed codes)
+
+        Args:
+            celebrity_name: Name of the celebrity
+            faiss_ids: FAISS IDs of the vectors
+
+        Returns:
+            Numpy array of shape (len(faiss_ids), embedding_dim)
+        """
+        if celebrity_name not in self.indexes:
+            logger.error(f"No index loaded for {celebrity_name}")
+            raise ValueError(f"Index not found for {celebrity_name}")
+
+        return self.indexes[celebrity_name].reconstruct_batch(np.asarray(faiss_ids, dtype='int64'))
 
     def get_index_size(self, celebrity_name: str) -> int:
         """Get number of vectors in the index"""
-        return self.index_sizes.get(celebrity_name, 0)
+        index = self.indexes.get(celebrity_name)
+        return index.ntotal if index is not None else 0
 
     def index_exists(self, celebrity_name: str) -> bool:
         """Check if index exists on disk"""
         return os.path.exists(self._get_index_path(celebrity_name))
 
+    def get_index_mtime(self, celebrity_name: str) -> Optional[float]:
+        """Get modification time of the index file on disk (None if missing)"""
+        try:
+            return os.path.getmtime(self._get_index_path(celebrity_name))
+        except OSError:
+            return None
+
     def delete_index(self, celebrity_name: str):
         """Delete index from memory and disk"""
-        if celebrity_name in self.indexes:
-            del self.indexes[celebrity_name]
-            del self.index_sizes[celebrity_name]
+        self.indexes.pop(celebrity_name, None)
+        self.index_types.pop(celebrity_name, None)
+        self._invalidate_search_cache(celebrity_name)
 
         index_path = self._get_index_path(celebrity_name)
-        size_path = self._get_size_path(celebrity_name)
 
         if os.path.exists(index_path):
             os.remove(index_path)
-        if os.path.exists(size_path):
-            os.remove(size_path)
 
         logger.info(f"Deleted index for {celebrity_name}")
 
@@ -6,28 +6,107 @@ FAISS only stores vectors - this stores all the context
 
 import json
 import os
-from typing import List, Dict, Optional
-from datetime import datetime
+import sys
+import time
+from collections import Counter
+from operator import itemgetter
+from typing import List, Dict, Optional, Sequence
+import numpy as np
 from utils.logger import get_logger
 
+# Optional: msgpack loads/saves metadata several times faster than JSON, with
+# smaller files and integer FAISS IDs kept as integer keys
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional: orjson parses/serializes the JSON fallback several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Per-question fields, stored column-wise (one list per field, indexed by FAISS ID)
+METADATA_FIELDS = (
+    "question_text",
+    "source_type",
+    "source_url",
+    "source_title",
+    "timestamp",
+    "date",
+    "indexed_at",
+)
+
+# Fields whose values repeat across many questions (one source yields many
+# questions); interned so every row shares a single string object
+INTERNED_FIELDS = ("source_type", "source_url", "source_title", "date")
+
 
 class MetadataStore:
     """
     Stores metadata for each question indexed in FAISS
     Maps FAISS ID -> Question Metadata
+
+    Stored column-wise: per celebrity, one list per field, where position i
+    holds question i (FAISS IDs are sequential from 0). Rows are rebuilt as
+    dicts on lookup
     """
 
     def __init__(self, storage_dir: str = "data/metadata"):
         self.storage_dir = storage_dir
         os.makedirs(storage_dir, exist_ok=True)
-        self.metadata = {}  # celebrity_name -> {faiss_id: metadata}
+        self.columns = {}  # celebrity_name -> {field: [value or None per faiss_id]}
+        self.counts = {}  # celebrity_name -> number of stored questions
+
+    def _get_metadata_path(self, celebrity_name: str, fmt: Optional[str] = None) -> str:
+        """
+        Get file path for celebrity's metadata
 
-    def _get_metadata_path(self, celebrity_name: str) -> str:
-        """Get file path for celebrity's metadata"""
+        Args:
+            celebrity_name: Name of the celebrity
+            fmt: 'msgpack' or 'json' (default: msgpack when installed)
+        """
+        if fmt is None:
+            fmt = "msgpack" if msgpack else "json"
         safe_name = celebrity_name.lower().replace(" ", "_")
-        return os.path.join(self.storage_dir, f"{safe_name}_metadata.json")
+        return os.path.join(self.storage_dir, f"{safe_name}_metadata.{fmt}")
+
+    def _find_metadata_file(self, celebrity_name: str) -> Optional[str]:
+        """Existing metadata file for a celebrity, preferring msgpack over legacy JSON"""
+        for fmt in (("msgpack", "json") if msgpack else ("json",)):
+            path = self._get_metadata_path(celebrity_name, fmt)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _empty_columns() -> Dict[str, List]:
+        """Column dict with no rows"""
+        return {field: [] for field in METADATA_FIELDS}
+
+    @staticmethod
+    def _columns_from_rows(rows: Dict[int, Dict]) -> Dict[str, List]:
+        """Convert the legacy {faiss_id: metadata dict} layout to columns"""
+        size = max(rows, default=-1) + 1
+        columns = {field: [None] * size for field in METADATA_FIELDS}
+
+        for faiss_id, metadata in rows.items():
+            for field in METADATA_FIELDS:
+                columns[field][faiss_id] = metadata.get(field)
+
+        return columns
+
+    @staticmethod
+    def _intern_columns(columns: Dict[str, List]):
+        """Share one string object per distinct value in the repetitive columns"""
+        for field in INTERNED_FIELDS:
+            columns[field] = [
+                sys.intern(value) if isinstance(value, str) else value
+                for value in columns[field]
+            ]
 
     def load_metadata(self, celebrity_name: str) -> bool:
         """
@@ -39,27 +118,45 @@ class MetadataStore:
         Returns:
             True if loaded successfully, False otherwise
         """
-        metadata_path = self._get_metadata_path(celebrity_name)
+        metadata_path = self._find_metadata_file(celebrity_name)
 
-        if not os.path.exists(metadata_path):
+        if metadata_path is None:
             logger.warning(f"No metadata found for {celebrity_name}")
-            self.metadata[celebrity_name] = {}
+            self.columns[celebrity_name] = self._empty_columns()
+            self.counts[celebrity_name] = 0
             return False
 
         try:
             logger.info(f"Loading metadata for {celebrity_name}")
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Convert string keys back to integers
-            self.metadata[celebrity_name] = {int(k): v for k, v in data.items()}
-
-            logger.info(f"Loaded metadata for {len(self.metadata[celebrity_name])} questions")
+            if metadata_path.endswith(".msgpack"):
+                with open(metadata_path, 'rb') as f:
+                    data = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+            elif orjson:
+                with open(metadata_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+            if "columns" in data:
+                columns = data["columns"]
+            else:
+                # Legacy row layout: {faiss_id: metadata dict} (string keys in JSON)
+                columns = self._columns_from_rows({int(k): v for k, v in data.items()})
+
+            self._intern_columns(columns)
+            self.columns[celebrity_name] = columns
+            self.counts[celebrity_name] = sum(
+                text is not None for text in columns["question_text"]
+            )
+
+            logger.info(f"Loaded metadata for {self.counts[celebrity_name]} questions")
             return True
 
         except Exception as e:
             logger.error(f"Error loading metadata: {e}")
-            self.metadata[celebrity_name] = {}
+            self.columns[celebrity_name] = self._empty_columns()
+            self.counts[celebrity_name] = 0
             return False
 
     def save_metadata(self, celebrity_name: str):
@@ -69,20 +166,33 @@ class MetadataStore:
         Args:
             celebrity_name: Name of the celebrity
         """
-        if celebrity_name not in self.metadata:
+        if celebrity_name not in self.columns:
             logger.error(f"No metadata found for {celebrity_name}")
             return
 
         metadata_path = self._get_metadata_path(celebrity_name)
+        data = {"columns": self.columns[celebrity_name]}
 
         try:
             logger.info(f"Saving metadata for {celebrity_name}")
 
-            # Convert int keys to strings for JSON
-            data = {str(k): v for k, v in self.metadata[celebrity_name].items()}
-
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write then rename, so a crash mid-write can't leave a truncated file
+            tmp_path = f"{metadata_path}.tmp"
+            if msgpack:
+                with open(tmp_path, 'wb') as f:
+                    f.write(msgpack.packb(data, use_bin_type=True))
+            elif orjson:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, metadata_path)
+
+            # Drop the copy in the other format so a stale one can't be loaded later
+            other_path = self._get_metadata_path(celebrity_name, "json" if msgpack else "msgpack")
+            if os.path.exists(other_path):
+                os.remove(other_path)
 
             logger.info(f"Saved metadata to {metadata_path}")
 
@@ -111,28 +221,48 @@ class MetadataStore:
                 - timestamp: Optional timestamp in the source
                 - date: Date of the interview/article
         """
-        if celebrity_name not in self.metadata:
-            self.metadata[celebrity_name] = {}
+        if celebrity_name not in self.columns:
+            self.columns[celebrity_name] = self._empty_columns()
+            self.counts[celebrity_name] = 0
 
         if len(faiss_ids) != len(questions) or len(faiss_ids) != len(sources):
             raise ValueError("Length mismatch: faiss_ids, questions, and sources must have same length")
 
+        columns = self.columns[celebrity_name]
+        texts = columns["question_text"]
+
+        # One timestamp for the whole batch, as epoch seconds (compact, sortable)
+        indexed_at = int(time.time())
+
+        # Grow every column to cover the new IDs (normally appends at the end)
+        missing = max(faiss_ids, default=-1) + 1 - len(texts)
+        if missing > 0:
+            for column in columns.values():
+                column.extend([None] * missing)
+
         for faiss_id, question, source in zip(faiss_ids, questions, sources):
-            metadata = {
-                "celebrity_name": celebrity_name,
-                "question_text": question,
-                "source_type": source.get("source_type"),
-                "source_url": source.get("source_url"),
-                "source_title": source.get("source_title"),
-                "timestamp": source.get("timestamp"),
-                "date": source.get("date"),
-                "indexed_at": datetime.utcnow().isoformat()
-            }
-
-            self.metadata[celebrity_name][faiss_id] = metadata
+            if texts[faiss_id] is None:
+                self.counts[celebrity_name] += 1
+
+            texts[faiss_id] = question
+            for field in INTERNED_FIELDS:
+                value = source.get(field)
+                columns[field][faiss_id] = sys.intern(value) if isinstance(value, str) else value
+            columns["timestamp"][faiss_id] = source.get("timestamp")
+            columns["indexed_at"][faiss_id] = indexed_at
 
         logger.info(f"Added metadata for {len(faiss_ids)} questions")
 
+    def _row(self, celebrity_name: str, columns: Dict[str, List], faiss_id: int) -> Optional[Dict]:
+        """Rebuild one question's metadata dict from the columns (None if absent)"""
+        if not 0 <= faiss_id < len(columns["question_text"]) or columns["question_text"][faiss_id] is None:
+            return None
+
+        metadata = {"celebrity_name": celebrity_name}
+        for field in METADATA_FIELDS:
+            metadata[field] = columns[field][faiss_id]
+        return metadata
+
     def get_metadata(self, celebrity_name: str, faiss_id: int) -> Optional[Dict]:
         """
         Get metadata for a specific FAISS ID
@@ -144,10 +274,10 @@ class MetadataStore:
         Returns:
             Metadata dict or None if not found
         """
-        if celebrity_name not in self.metadata:
+        if celebrity_name not in self.columns:
             return None
 
-        return self.metadata[celebrity_name].get(faiss_id)
+        return self._row(celebrity_name, self.columns[celebrity_name], faiss_id)
 
     def get_batch_metadata(
         self,
@@ -162,40 +292,114 @@ class MetadataStore:
             faiss_ids: List of FAISS IDs
 
         Returns:
-            List of metadata dicts (None for missing IDs)
+            List of metadata dicts (None for missing IDs); each dict is a new
+            copy, safe for the caller to modify
         """
-        if celebrity_name not in self.metadata:
+        if celebrity_name not in self.columns:
             return [None] * len(faiss_ids)
 
-        return [
-            self.metadata[celebrity_name].get(faiss_id)
-            for faiss_id in faiss_ids
-        ]
+        columns = self.columns[celebrity_name]
+
+        return [self._row(celebrity_name, columns, faiss_id) for faiss_id in faiss_ids]
+
+    def get_batch_columns(
+        self,
+        celebrity_name: str,
+        faiss_ids: Sequence[int],
+        fields: Sequence[str] = METADATA_FIELDS
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get selected fields for multiple FAISS IDs, column-wise
+        (no per-row dicts; for callers that work on whole columns)
+
+        Args:
+            celebrity_name: Name of the celebrity
+            faiss_ids: List or array of FAISS IDs
+            fields: Fields to return (default: all)
+
+        Returns:
+            Dict mapping each field to an object array aligned with faiss_ids
+            (None for missing IDs)
+        """
+        ids = np.asarray(faiss_ids, dtype=np.int64).reshape(-1)
+        columns = self.columns.get(celebrity_name)
+        result = {field: np.full(len(ids), None, dtype=object) for field in fields}
+
+        if columns is None:
+            return result
+
+        # Gather only in-range IDs; itemgetter does the lookups in C
+        valid = np.flatnonzero((ids >= 0) & (ids < len(columns["question_text"])))
+        if len(valid):
+            gather = itemgetter(*ids[valid].tolist())
+            for field in fields:
+                values = gather(columns[field]) if len(valid) > 1 else (gather(columns[field]),)
+                result[field][valid] = np.fromiter(values, dtype=object, count=len(valid))
+
+        return result
+
+    def find_faiss_ids(
+        self,
+        celebrity_name: str,
+        questions: List[str]
+    ) -> List[Optional[int]]:
+        """
+        Look up the FAISS IDs of question texts that are already indexed
+
+        Args:
+            celebrity_name: Name of the celebrity
+            questions: Question texts
+
+        Returns:
+            List of FAISS IDs (None for texts not indexed yet)
+        """
+        texts = self.columns.get(celebrity_name, {}).get("question_text", [])
+        text_to_id = {text: faiss_id for faiss_id, text in enumerate(texts) if text is not None}
+
+        return [text_to_id.get(question) for question in questions]
 
     def get_all_metadata(self, celebrity_name: str) -> Dict[int, Dict]:
         """Get all metadata for a celebrity"""
-        return self.metadata.get(celebrity_name, {})
+        if celebrity_name not in self.columns:
+            return {}
+
+        columns = self.columns[celebrity_name]
+        return {
+            faiss_id: self._row(celebrity_name, columns, faiss_id)
+            for faiss_id, text in enumerate(columns["question_text"])
+            if text is not None
+        }
 
     def delete_metadata(self, celebrity_name: str):
         """Delete metadata from memory and disk"""
-        if celebrity_name in self.metadata:
-            del self.metadata[celebrity_name]
+        self.columns.pop(celebrity_name, None)
+        self.counts.pop(celebrity_name, None)
 
-        metadata_path = self._get_metadata_path(celebrity_name)
-        if os.path.exists(metadata_path):
-            os.remove(metadata_path)
+        for fmt in ("msgpack", "json"):
+            metadata_path = self._get_metadata_path(celebrity_name, fmt)
+            if os.path.exists(metadata_path):
+                os.remove(metadata_path)
 
         logger.info(f"Deleted metadata for {celebrity_name}")
 
     def metadata_exists(self, celebrity_name: str) -> bool:
         """Check if metadata exists on disk"""
-        return os.path.exists(self._get_metadata_path(celebrity_name))
+        return self._find_metadata_file(celebrity_name) is not None
+
+    def get_metadata_mtime(self, celebrity_name: str) -> Optional[float]:
+        """Get modification time of the metadata file on disk (None if missing)"""
+        metadata_path = self._find_metadata_file(celebrity_name)
+        if metadata_path is None:
+            return None
+
+        try:
+            return os.path.getmtime(metadata_path)
+        except OSError:
+            return None
 
     def get_question_count(self, celebrity_name: str) -> int:
         """Get number of questions indexed for a celebrity"""
-        if celebrity_name not in self.metadata:
-            return 0
-        return len(self.metadata[celebrity_name])
+        return self.counts.get(celebrity_name, 0)
 
     def get_sources_summary(self, celebrity_name: str) -> Dict[str, int]:
         """
@@ -204,15 +408,21 @@ class MetadataStore:
         Returns:
             Dict mapping source_type to count
         """
-        if celebrity_name not in self.metadata:
+        if celebrity_name not in self.columns:
             return {}
 
-        summary = {}
-        for metadata in self.metadata[celebrity_name].values():
-            source_type = metadata.get("source_type", "unknown")
-            summary[source_type] = summary.get(source_type, 0) + 1
+        columns = self.columns[celebrity_name]
+        source_types = columns["source_type"]
+
+        # Without gaps in the FAISS IDs every row is a question: count the column directly
+        if self.counts[celebrity_name] == len(source_types):
+            return dict(Counter(source_types))
 
-        return summary
+        return dict(Counter(
+            source_type
+            for text, source_type in zip(columns["question_text"], source_types)
+            if text is not None
+        ))
 
 
 if __name__ == "__main__":